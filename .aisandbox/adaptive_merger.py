@@ -16,21 +16,469 @@ Key Use Case:
 - System intelligently maps and ingests the new data into your target schema
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
+import logging
 import os
+import re
+import sqlite3
 import sys
 import textwrap
-import yaml
-import numpy as np
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
-import pandas as pd
-from openai import OpenAI
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+# pandas, numpy, openai, yaml, pyarrow and dotenv are imported where they are used,
+# so importing this module (e.g. for TableConfig or the CLI help) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# orjson is optional and cheap to import; it encodes the prompt payloads and decodes the LLM responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Rows sent to the LLM per prompt_merge request and number of requests in flight, across all fields
+PROMPT_MERGE_BATCH_SIZE = 50
+MAX_LLM_CONCURRENCY = 8
+LLM_MAX_RETRIES = 3
+
+# Shared by every _llm_batch call, so concurrent fields cannot multiply the number of requests in flight
+_LLM_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_LLM_CONCURRENCY)
+
+# LLM-bound field strategies run concurrently across target columns (each writes its own column)
+LLM_STRATEGIES = {"prompt_merge"}
+MAX_FIELD_CONCURRENCY = 4
+
+# Opt-in local store for LLM responses (INTABULAR_LLM_CACHE=true or use_cache=True); entries expire
+# after LLM_CACHE_TTL_SECONDS, and semantic lookups reuse an analysis within this cosine distance
+LLM_CACHE_DIR = '.llm_cache'  # overridden by INTABULAR_LLM_CACHE_DIR
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600  # overridden by INTABULAR_LLM_CACHE_TTL
+LLM_CACHE_SCHEMA_VERSION = 2
+SEMANTIC_CACHE_MAX_DISTANCE = 0.05
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Cosine similarity between target description and source column signature:
+# at or above ACCEPT the column is mapped without the LLM, above REVIEW it is suggested to the LLM
+MAPPING_ACCEPT_SIMILARITY = 0.75
+MAPPING_REVIEW_SIMILARITY = 0.55
+
+# Rows read for structure analysis and per chunk when streaming the ingestion
+ANALYSIS_SAMPLE_ROWS = 10_000
+INGEST_CHUNK_ROWS = 50_000
+
+# Source columns with fewer distinct values than this share of their rows are held as categoricals
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.1
+
+# Standardized name columns repeat far more than free text, so they are held as categoricals up to this ratio
+NAME_CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+
+# Prompt payloads are sent as compact JSON with long sample values cut short
+COMPACT_JSON = (",", ":")
+SAMPLE_VALUE_MAX_CHARS = 40
+
+# Kept as plain strings: on Arrow-backed columns pandas hands these to RE2 (pyarrow.compute), compiled re.Patterns are not
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+NON_DIGIT_PATTERN = r'[^\d]'
+EMAIL_RE = re.compile(EMAIL_PATTERN)  # for object columns, which go through Python's re
+
+# Structured-output formats. They are non-strict, so the API only guarantees syntactically valid JSON;
+# the keys the code indexes into are checked with _require_keys before use
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "csv_analysis",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "table_purpose": {"type": "string", "description": "Inferred business purpose based on all columns and data"},
+                "data_source": {"type": "string", "description": "Likely platform or system this came from"},
+                "column_semantics": {
+                    "type": "object",
+                    "description": "One entry per source column, keyed by the exact column name",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "semantic_type": {
+                                "type": "string",
+                                "enum": ["email", "name", "company", "phone", "address", "identifier", "text", "number",
+                                         "date", "url", "social", "industry", "title", "location", "other"]
+                            },
+                            "confidence": {"type": "number"},
+                            "description": {"type": "string", "description": "What this column represents based on name and data"},
+                            "data_pattern": {"type": "string", "description": "Observed pattern in actual values"},
+                            "business_value": {"type": "string", "description": "How valuable this data is for business use"},
+                            "data_quality": {"type": "string", "description": "Assessment based on completeness and consistency"}
+                        },
+                        "required": ["semantic_type", "confidence", "description", "data_pattern", "business_value", "data_quality"]
+                    }
+                },
+                "data_patterns": {
+                    "type": "object",
+                    "properties": {
+                        "primary_entity": {"type": "string", "description": "What each row represents"},
+                        "identifier_candidates": {"type": "array", "items": {"type": "string"}},
+                        "contact_info": {"type": "array", "items": {"type": "string"}},
+                        "personal_data": {"type": "array", "items": {"type": "string"}},
+                        "business_data": {"type": "array", "items": {"type": "string"}},
+                        "behavioral_data": {"type": "array", "items": {"type": "string"}},
+                        "metadata": {"type": "array", "items": {"type": "string"}}
+                    }
+                },
+                "quality_assessment": {
+                    "type": "object",
+                    "properties": {
+                        "overall_completeness": {"type": "string", "description": "Percentage of complete data"},
+                        "data_consistency": {"type": "string", "description": "How consistent the formats are"},
+                        "potential_duplicates": {"type": "string", "description": "Likelihood of duplicate records"},
+                        "enrichment_level": {"type": "string", "description": "How enriched this data appears"}
+                    }
+                },
+                "source_identification": {
+                    "type": "object",
+                    "properties": {
+                        "platform_confidence": {"type": "number"},
+                        "platform_indicators": {"type": "array", "items": {"type": "string"}},
+                        "export_type": {"type": "string", "enum": ["contact_list", "lead_export", "crm_export", "social_export", "other"]}
+                    }
+                }
+            },
+            "required": ["table_purpose", "data_source", "column_semantics", "data_patterns",
+                         "quality_assessment", "source_identification"]
+        }
+    }
+}
+
+STRATEGY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ingestion_strategy",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "field_strategies": {
+                    "type": "object",
+                    "description": "One entry per target column, keyed by the exact target column name",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "strategy": {"type": "string", "enum": ["replace", "prompt_merge", "concat", "derive", "preserve", "transform"]},
+                            "source_mapping": {"type": "array", "items": {"type": "string"}},
+                            "confidence": {"type": "number"},
+                            "reasoning": {"type": "string", "description": "Why this strategy was chosen"},
+                            "transformation_rule": {"type": "string", "description": "For transform/derive: the rule to apply"},
+                            "prompt_template": {"type": "string", "description": "For prompt_merge: the LLM prompt to use"},
+                            "fallback_strategy": {"type": "string", "description": "What to do if the primary strategy fails"}
+                        },
+                        "required": ["strategy", "source_mapping", "confidence", "reasoning"]
+                    }
+                },
+                "unmapped_source_columns": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "reason": {"type": "string"},
+                            "potential_use": {"type": "string"},
+                            "action": {"type": "string", "enum": ["ignore", "store_as_metadata", "create_new_target_column"]}
+                        },
+                        "required": ["reason", "action"]
+                    }
+                },
+                "data_quality_rules": {
+                    "type": "object",
+                    "properties": {
+                        "deduplication": {
+                            "type": "object",
+                            "properties": {
+                                "strategy": {"type": "string", "enum": ["email_based", "name_company_based", "custom"]},
+                                "key_fields": {"type": "array", "items": {"type": "string"}},
+                                "resolution": {"type": "string", "enum": ["prefer_target", "prefer_source", "merge_both"]}
+                            }
+                        },
+                        "validation": {
+                            "type": "object",
+                            "properties": {
+                                "email_validation": {"type": "boolean"},
+                                "phone_formatting": {"type": "boolean"},
+                                "name_standardization": {"type": "boolean"}
+                            }
+                        },
+                        "cleanup": {
+                            "type": "object",
+                            "properties": {
+                                "trim_whitespace": {"type": "boolean"},
+                                "standardize_formats": {"type": "boolean"},
+                                "handle_nulls": {"type": "string", "enum": ["preserve", "replace_with_empty", "skip"]}
+                            }
+                        }
+                    }
+                },
+                "ingestion_plan": {
+                    "type": "object",
+                    "properties": {
+                        "processing_order": {"type": "array", "items": {"type": "string"}},
+                        "conflict_resolution": {"type": "string"},
+                        "error_handling": {"type": "string", "enum": ["continue", "stop", "log_and_continue"]},
+                        "validation_checks": {"type": "array", "items": {"type": "string"}}
+                    }
+                },
+                "confidence_score": {"type": "number"},
+                "risk_assessment": {
+                    "type": "object",
+                    "properties": {
+                        "data_loss_risk": {"type": "string", "enum": ["low", "medium", "high"]},
+                        "quality_impact": {"type": "string", "enum": ["positive", "neutral", "negative"]},
+                        "schema_compatibility": {"type": "string", "enum": ["excellent", "good", "fair", "poor"]}
+                    }
+                },
+                "execution_summary": {
+                    "type": "object",
+                    "properties": {
+                        "total_fields_mapped": {"type": "integer"},
+                        "fields_requiring_llm": {"type": "integer"},
+                        "complex_transformations": {"type": "integer"},
+                        "estimated_processing_time": {"type": "string", "enum": ["fast", "medium", "slow"]}
+                    }
+                }
+            },
+            "required": ["field_strategies", "unmapped_source_columns", "data_quality_rules", "confidence_score"]
+        }
+    }
+}
+
+PROMPT_MERGE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "merged_values",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "values": {"type": "array", "items": {"type": "string"}, "description": "One merged value per input row, in order"}
+            },
+            "required": ["values"]
+        }
+    }
+}
+
+def _read_csv(csv_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+    """Read a CSV (optionally only the first nrows rows) with pyarrow when installed, else pandas
+    
+    Date/time columns are kept as text, matching pandas' default and keeping values JSON-serializable.
+    """
+    import pandas as pd
+    
+    # Arrow's multithreaded CSV parser is optional
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return pd.read_csv(csv_path, nrows=nrows)
+    
+    try:
+        with pa_csv.open_csv(csv_path) as probe:
+            text_columns = {field.name: pa.string() for field in probe.schema if pa.types.is_temporal(field.type)}
+        convert_options = pa_csv.ConvertOptions(column_types=text_columns, strings_can_be_null=True)
+        
+        if nrows is None:
+            table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+        else:
+            batches = []
+            row_count = 0
+            with pa_csv.open_csv(csv_path, convert_options=convert_options) as reader:
+                for batch in reader:
+                    batches.append(batch)
+                    row_count += batch.num_rows
+                    if row_count >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+        
+        return table.to_pandas()
+    
+    except pa.ArrowInvalid:
+        # Column types changing after the first block, ragged rows, ... - pandas copes with these
+        return pd.read_csv(csv_path, nrows=nrows)
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, with orjson when installed (unknown types fall back to str)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, separators=COMPACT_JSON, ensure_ascii=False, default=str)
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _require_keys(data: Any, required: Dict[str, type], what: str) -> Dict[str, Any]:
+    """Check that an LLM JSON response is an object holding the required keys with the expected types"""
+    if not isinstance(data, dict):
+        raise ValueError(f"{what}: expected a JSON object, got {type(data).__name__}")
+    for key, expected in required.items():
+        if not isinstance(data.get(key), expected):
+            raise ValueError(f"{what}: '{key}' is missing or not a {expected.__name__}")
+    return data
+
+def _string_dtype(storage: Optional[str]) -> Any:
+    """Text column dtype for the given StringDtype storage ('pyarrow' or 'python'); None keeps plain str"""
+    import numpy as np
+    import pandas as pd
+    
+    if storage is None:
+        return str
+    try:
+        try:
+            # Missing values stay NaN, as with dtype=str
+            return pd.StringDtype(storage, na_value=np.nan)
+        except TypeError:
+            # pandas < 2.3 only has the pd.NA variant
+            return pd.StringDtype(storage)
+    except ImportError:
+        logger.debug("pyarrow is not installed, keeping plain str columns")
+        return str
 
-# Load environment variables
-load_dotenv()
+def _as_text(data: Union[pd.Series, pd.DataFrame], dtype: Any) -> Union[pd.Series, pd.DataFrame]:
+    """Cast to the text dtype with missing values as ''"""
+    if dtype is str:
+        # Plain str casts turn NaN into 'nan' on pandas < 3, so fill first
+        return data.fillna('').astype(str)
+    # StringDtype keeps missing values missing, so one cast then a fill on the already-string data
+    return data.astype(dtype).fillna('')
+
+def _ensure_string_dtype(data: pd.Series, dtype: Any) -> pd.Series:
+    """data cast to dtype, or data itself when it already holds a string dtype"""
+    import pandas as pd
+    
+    if isinstance(data.dtype, pd.StringDtype):
+        return data
+    return data.astype(dtype)
+
+def _digits_only(data: pd.Series, dtype: Any = str) -> Optional[pd.Series]:
+    """Keep only the ASCII digits of each value, scanning the Arrow UTF-8 buffer as one byte array
+    
+    Returns None when pyarrow is missing or the values cannot be handled that way; callers then use the regex.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    try:
+        import pyarrow as pa
+        values = pa.array(data, type=pa.large_string(), from_pandas=True)
+    except (ImportError, TypeError, ValueError):
+        # pyarrow missing, or non-string values (ArrowTypeError/ArrowInvalid subclass these)
+        return None
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    validity, offsets, chars = values.buffers()
+    if values.offset or chars is None:
+        return None
+    
+    # Digit bytes never occur inside multi-byte UTF-8 sequences, so a byte mask is exact
+    offsets = np.frombuffer(offsets, dtype=np.int64)[:len(values) + 1]
+    chars = np.frombuffer(chars, dtype=np.uint8)[offsets[0]:offsets[-1]]
+    keep = (chars >= ord('0')) & (chars <= ord('9'))
+    kept_before = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+    digits = pa.LargeStringArray.from_buffers(len(values), pa.py_buffer(kept_before[offsets - offsets[0]]),
+                                              pa.py_buffer(chars[keep]), validity, values.null_count)
+    return pd.Series(digits, index=data.index, dtype=dtype)
+
+def _align_length(target_df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """Extend target_df to n rows in one allocation; the new rows are all-NaN"""
+    if n > len(target_df):
+        return target_df.reset_index(drop=True).reindex(range(n))
+    return target_df
+
+def _join_columns(df: pd.DataFrame, sep: str = ' ', dtype: Any = str) -> pd.Series:
+    """Join each row's values (missing as '') with sep into a Series of the given dtype
+    
+    String columns go through one fused pyarrow binary_join_element_wise pass when pyarrow is
+    installed; anything else falls back to one elementwise object-array add per column.
+    """
+    import pandas as pd
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        text = pa.large_string()
+        columns = [pa.array(column, type=text, from_pandas=True) for _, column in df.items()]
+        joined = pc.binary_join_element_wise(*columns, pa.scalar(sep, text),
+                                             null_handling='replace', null_replacement='')
+        return pd.Series(joined, index=df.index, dtype=dtype)
+    except ImportError:
+        pass
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Non-string values (numbers, ...) in an object column
+        pass
+    
+    values = df.fillna('').astype(str).to_numpy(dtype=object)
+    joined = values[:, 0]
+    for i in range(1, values.shape[1]):
+        joined = joined + sep + values[:, i]
+    return pd.Series(joined, index=df.index, dtype=dtype)
+
+def _join_columns_polars(df: pd.DataFrame, sep: str = ' ', dtype: Any = str) -> Optional[pd.Series]:
+    """_join_columns on Polars' multithreaded concat_str; None when Polars is not installed"""
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+    import pandas as pd
+    import pyarrow as pa
+    
+    frame = pl.from_pandas(df)
+    joined = frame.select(
+        pl.concat_str([pl.col(col).cast(pl.Utf8).fill_null('') for col in frame.columns], separator=sep)
+    ).to_series()
+    return pd.Series(joined.to_arrow().cast(pa.large_string()), index=df.index, dtype=dtype)
+
+def _name_columns(df: pd.DataFrame) -> List[str]:
+    """Columns that hold (parts of) names, by column name"""
+    return df.columns[df.columns.str.contains('name', case=False, regex=False)].tolist()
+
+def _encode_categoricals(df: pd.DataFrame, columns: List[str], max_unique_ratio: float) -> pd.DataFrame:
+    """Store low-cardinality columns as categoricals: int codes plus one copy of each value"""
+    if df.empty:
+        return df
+    
+    unique_ratio = df[columns].nunique() / len(df)
+    low_cardinality = unique_ratio.index[unique_ratio < max_unique_ratio]
+    return df.astype(dict.fromkeys(low_cardinality, 'category')) if len(low_cardinality) else df
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows stay zero instead of turning into NaN"""
+    import numpy as np
+    
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+def _decode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Turn categorical columns back into their value dtype, keeping missing values missing"""
+    import pandas as pd
+    
+    value_dtypes = {col: dtype.categories.dtype for col, dtype in df.dtypes.items()
+                    if isinstance(dtype, pd.CategoricalDtype)}
+    return df.astype(value_dtypes) if value_dtypes else df
+
+def _map_categories(data: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Apply a vectorized Series function; categorical data is mapped once per category and expanded by its codes"""
+    import pandas as pd
+    
+    if not isinstance(data.dtype, pd.CategoricalDtype):
+        return func(data)
+    mapped = func(pd.Series(data.cat.categories))
+    # Code -1 marks a missing value, which take fills with the result dtype's missing value
+    return pd.Series(mapped.array.take(data.cat.codes.to_numpy(), allow_fill=True), index=data.index, name=data.name)
 
 @dataclass
 class TableConfig:
@@ -43,8 +491,11 @@ class TableConfig:
     @classmethod
     def from_yaml(cls, yaml_path: str) -> 'TableConfig':
         """Load configuration from YAML file"""
+        import yaml
+        
+        # Prefer PyYAML's libyaml bindings when they were compiled in
         with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         
         # Handle enrichment_columns - support both list and dict formats
         enrichment_columns = data.get('enrichment_columns', [])
@@ -64,6 +515,8 @@ class TableConfig:
     
     def to_yaml(self, yaml_path: str):
         """Save configuration to YAML file"""
+        import yaml
+        
         data = {
             'purpose': self.purpose,
             'enrichment_columns': self.enrichment_columns,
@@ -74,7 +527,7 @@ class TableConfig:
             data['target'] = self.target
         
         with open(yaml_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), default_flow_style=False)
     
     def get_enrichment_column_names(self) -> List[str]:
         """Get list of enrichment column names regardless of format"""
@@ -92,178 +545,297 @@ class TableConfig:
         """Get column policy as descriptive text"""
         return str(self.column_policy)
 
+class LLMCache:
+    """SQLite-backed LLM response store with exact (hash) and semantic (embedding) lookup
+    
+    Entries older than the TTL (INTABULAR_LLM_CACHE_TTL seconds, default one week) are ignored and
+    purged on open. To clear the cache, delete the cache directory (.llm_cache/ or INTABULAR_LLM_CACHE_DIR)
+    or call clear().
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        cache_dir = cache_dir or os.getenv('INTABULAR_LLM_CACHE_DIR', LLM_CACHE_DIR)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv('INTABULAR_LLM_CACHE_TTL', LLM_CACHE_TTL_SECONDS))
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(Path(cache_dir) / "llm_cache.sqlite"), check_same_thread=False)
+        self._lock = threading.Lock()
+        # Embeddings are loaded once on the first semantic lookup and kept in step by add_vector
+        self._vectors = None
+        with self._lock, self._conn:
+            # Stores from before the TTL column are dropped rather than migrated; it is only a cache
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != LLM_CACHE_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+                self._conn.execute("DROP TABLE IF EXISTS embeddings")
+                self._conn.execute(f"PRAGMA user_version = {LLM_CACHE_SCHEMA_VERSION}")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT, created REAL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB, response TEXT, created REAL)")
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (self._expiry(),))
+            self._conn.execute("DELETE FROM embeddings WHERE created < ?", (self._expiry(),))
+    
+    def _expiry(self) -> float:
+        """Creation time before which entries are stale"""
+        return time.time() - self.ttl_seconds
+    
+    def clear(self):
+        """Remove every cached response and embedding"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM embeddings")
+            self._vectors = None
+    
+    @staticmethod
+    def make_key(**request) -> str:
+        """Hash the request parameters (model, messages, temperature, ...)"""
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ? AND created >= ?",
+                                     (key, self._expiry())).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, response: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, response, time.time()))
+    
+    def nearest(self, vector: np.ndarray, max_distance: float) -> Optional[str]:
+        """Return the stored response whose embedding is closest to vector, if within max_distance"""
+        import numpy as np
+        
+        with self._lock:
+            if self._vectors is None:
+                rows = self._conn.execute("SELECT vector, response, created FROM embeddings").fetchall()
+                self._vectors = [(self._unit(np.frombuffer(blob, dtype=np.float32)), response, created)
+                                 for blob, response, created in rows]
+            entries = [entry for entry in self._vectors if entry[2] >= self._expiry()]
+        if not entries:
+            return None
+        
+        distances = 1.0 - np.stack([unit for unit, _, _ in entries]) @ self._unit(vector)
+        best = int(distances.argmin())
+        return entries[best][1] if distances[best] < max_distance else None
+    
+    @staticmethod
+    def _unit(vector: np.ndarray) -> np.ndarray:
+        import numpy as np
+        
+        return _unit_rows(np.asarray(vector, dtype=np.float32)[np.newaxis])[0]
+    
+    def add_vector(self, key: str, vector: np.ndarray, response: str):
+        import numpy as np
+        
+        created = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+                               (key, vector.astype(np.float32).tobytes(), response, created))
+            if self._vectors is not None:
+                self._vectors.append((self._unit(vector), response, created))
+
 class AdaptiveMerger:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the adaptive merger with OpenAI API key"""
+    def __init__(self, api_key: Optional[str] = None, use_cache: Optional[bool] = None, semantic_cache: bool = False,
+                 string_backend: Optional[str] = "pyarrow", backend: str = "pandas"):
+        """Initialize the adaptive merger with OpenAI API key
+        
+        string_backend picks the storage of the text columns read at ingest time: "pyarrow" runs the
+        .str operations of the transforms and quality rules as Arrow kernels, "python" or None keep objects.
+        backend="polars" runs the concat/derive column joins on Polars when it is installed.
+        use_cache stores LLM responses on disk (see LLMCache); None follows INTABULAR_LLM_CACHE (off by default).
+        """
+        from dotenv import load_dotenv
+        from openai import OpenAI
+        
+        # Load environment variables
+        load_dotenv()
+        
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.string_dtype = _string_dtype(string_backend)
+        self.backend = backend
+        
+        # Field strategy handlers, all called as handler(target_df, source_df, target_col, source_cols, field_strategy)
+        self.strategy_handlers = {
+            "replace": self._apply_replace_strategy,
+            "prompt_merge": self._apply_prompt_merge_strategy,
+            "concat": self._apply_concat_strategy,
+            "derive": self._apply_derive_strategy,
+            "transform": self._apply_transform_strategy,
+            "preserve": self._apply_preserve_strategy
+        }
+        
+        # Column transforms for the transform strategy, matched in this order against the transformation rule
+        self.transforms = {
+            "lowercase": lambda s: _ensure_string_dtype(s, self.string_dtype).str.lower(),
+            "standardize_email": lambda s: _ensure_string_dtype(s, self.string_dtype).str.strip().str.lower(),
+            "format_phone": self._format_phone
+        }
         
         if not self.api_key:
             raise ValueError("❌ OpenAI API key is required! Please set OPENAI_API_KEY in .env file")
         
         try:
             self.client = OpenAI(api_key=self.api_key)
-            print("✅ Using OpenAI LLM for intelligent data ingestion")
+            logger.info("✅ Using OpenAI LLM for intelligent data ingestion")
             
-            # Test the API connection
-            test_response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": "Test connection"}],
-                max_tokens=5
-            )
-            print(f"🔗 API connection verified")
+            # Auth errors surface on the first real call; opt into a cheap liveness probe if wanted
+            if os.getenv('INTABULAR_HEALTHCHECK'):
+                self.client.models.list()
+                logger.info("🔗 API connection verified")
             
         except Exception as e:
             raise RuntimeError(f"❌ Failed to initialize OpenAI client: {e}")
+        
+        # Created only once the merger is usable, so a failed init leaves nothing on disk
+        if use_cache is None:
+            use_cache = os.getenv('INTABULAR_LLM_CACHE', 'false').lower() == 'true'
+        self.cache = LLMCache() if use_cache else None
+        self.semantic_cache = semantic_cache and use_cache
+        
+        # Unit target-column embeddings by column signatures; the target schema rarely changes between ingestions
+        self._target_vectors: Dict[Tuple[str, ...], np.ndarray] = {}
     
     def analyze_unknown_csv(self, csv_path: str) -> Dict[str, Any]:
         """Analyze unknown CSV structure and infer semantic meaning of columns"""
+        import pandas as pd
         
-        # Read sample data
-        df = pd.read_csv(csv_path)
-        sample_data = df.head(10).to_dict('records')
-        
-        print(f"📊 CSV File Analysis: {Path(csv_path).name}")
-        print(f"   📈 Dimensions: {len(df)} rows × {len(df.columns)} columns")
-        print(f"   📋 Columns: {', '.join(df.columns[:5])}{'...' if len(df.columns) > 5 else ''}")
-        
-        # Build detailed column analysis with sample data
-        column_details = []
-        for col in df.columns:
-            sample_values = df[col].dropna().head(3).tolist()
-            non_null_count = df[col].notna().sum()
-            completeness = (non_null_count / len(df)) * 100
-            
-            column_details.append({
+        # Read a bounded sample - statistics are inferred from it, only the row count needs the whole file
+        df = _read_csv(csv_path, nrows=ANALYSIS_SAMPLE_ROWS)
+        if len(df) < ANALYSIS_SAMPLE_ROWS:
+            total_rows = len(df)
+        else:
+            with open(csv_path, 'rb') as f:
+                total_rows = sum(1 for _ in f) - 1
+        
+        logger.info("📊 CSV File Analysis: %s", Path(csv_path).name)
+        logger.info("   📈 Dimensions: %s rows × %s columns", total_rows, len(df.columns))
+        logger.info("   📋 Columns: %s%s", ', '.join(df.columns[:5]), '...' if len(df.columns) > 5 else '')
+        
+        # Build detailed column analysis with sample data - non-null and distinct counts in one agg call
+        column_stats = df.agg(['count', 'nunique'])
+        completeness_map = (column_stats.loc['count'].astype(float) / max(len(df), 1) * 100).round(1).to_dict()
+        nunique_map = column_stats.loc['nunique'].astype(int).to_dict()
+        dtypes_map = df.dtypes.astype(str).to_dict()
+        head_samples = df.head(3).to_dict('list')
+        
+        column_details = [
+            {
                 "name": col,
-                "sample_values": sample_values,
-                "completeness_percent": round(completeness, 1),
-                "data_type": str(df[col].dtype),
-                "unique_values": df[col].nunique()
-            })
-        
-        print(f"   🧠 Requesting LLM semantic analysis...")
+                # Only columns with gaps in the first rows need a search for non-null samples
+                "sample_values": samples if not pd.isna(samples).any() else df[col].dropna().head(3).tolist(),
+                "completeness_percent": completeness_map[col],
+                "data_type": dtypes_map[col],
+                "unique_values": nunique_map[col]
+            }
+            for col, samples in head_samples.items()
+        ]
+        
+        logger.info("   🧠 Requesting LLM semantic analysis...")
+        
+        prompt_columns = [
+            {**detail, "sample_values": [
+                value[:SAMPLE_VALUE_MAX_CHARS] if isinstance(value, str) else value
+                for value in detail["sample_values"]
+            ]}
+            for detail in column_details
+        ]
         
         prompt = textwrap.dedent(f"""
             Analyze this unknown CSV file by examining both column names AND actual data content:
             
             File: {Path(csv_path).name}
-            Total Rows: {len(df)}
+            Total Rows: {total_rows}
             
             Detailed Column Analysis:
-            {json.dumps(column_details, indent=2)}
+            {_json_dumps(prompt_columns)}
             
             For each column, analyze:
             1. Column name semantics (what the name suggests)
             2. Actual data content (what the values reveal)
             3. Business context (what this data represents)
             
-            Provide analysis in this JSON format:
-            {{
-                "table_purpose": "inferred_business_purpose_based_on_all_columns_and_data",
-                "data_source": "likely_platform_or_system_this_came_from",
-                "column_semantics": {{
-                    "column_name": {{
-                        "semantic_type": "email|name|company|phone|address|identifier|text|number|date|url|social|industry|title|location|other",
-                        "confidence": 0.95,
-                        "description": "what_this_column_represents_based_on_name_and_data",
-                        "data_pattern": "observed_pattern_in_actual_values",
-                        "business_value": "how_valuable_this_data_is_for_business_use",
-                        "data_quality": "assessment_based_on_completeness_and_consistency"
-                    }}
-                }},
-                "data_patterns": {{
-                    "primary_entity": "what_each_row_represents_based_on_data_analysis",
-                    "identifier_candidates": ["columns_that_could_uniquely_identify_records"],
-                    "contact_info": ["email_phone_address_columns"],
-                    "personal_data": ["name_title_demographic_columns"],
-                    "business_data": ["company_job_industry_columns"],
-                    "behavioral_data": ["engagement_activity_preference_columns"],
-                    "metadata": ["system_timestamp_source_columns"]
-                }},
-                "quality_assessment": {{
-                    "overall_completeness": "percentage_of_complete_data",
-                    "data_consistency": "how_consistent_the_formats_are",
-                    "potential_duplicates": "likelihood_of_duplicate_records",
-                    "enrichment_level": "how_enriched_this_data_appears"
-                }},
-                "source_identification": {{
-                    "platform_confidence": 0.85,
-                    "platform_indicators": ["specific_patterns_that_suggest_the_source"],
-                    "export_type": "contact_list|lead_export|crm_export|social_export|other"
-                }}
-            }}
-            
             Focus on understanding what each column actually contains by examining the real data values.
             Consider data patterns, naming conventions, and business context.
-            Return only valid JSON, no explanations.
         """).strip()
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
-            )
-            
-            # Better error handling for API response
-            if not response.choices or not response.choices[0].message.content:
-                raise ValueError("Empty response from OpenAI API")
-            
-            response_text = response.choices[0].message.content.strip()
-            if not response_text:
-                raise ValueError("Empty content in OpenAI API response")
-            
-            print(f"   🤖 LLM analysis received ({len(response_text)} characters)")
-            
-            # Strip markdown code blocks if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]  # Remove ```json
-            if response_text.startswith('```'):
-                response_text = response_text[3:]  # Remove ```
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]  # Remove trailing ```
-            response_text = response_text.strip()
-            
-            try:
-                analysis = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                print(f"   ❌ Failed to parse LLM response as JSON: {e}")
-                print(f"   📝 Raw response preview: {response_text[:200]}...")
-                raise ValueError(f"Invalid JSON response from LLM: {e}")
+            # Similar column layouts (same names, types, samples) can reuse an earlier analysis
+            signature_vector = None
+            response_text = None
+            if self.semantic_cache:
+                signature = _json_dumps([[c["name"], c["data_type"], c["sample_values"]] for c in column_details])
+                signature_vector = self._embed(signature)
+                response_text = self.cache.nearest(signature_vector, SEMANTIC_CACHE_MAX_DISTANCE)
+                if response_text:
+                    logger.info("   ♻️  Reusing cached analysis of a similar CSV")
+            
+            if response_text is None:
+                response_text = self._cached_completion(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format=ANALYSIS_RESPONSE_FORMAT,
+                    temperature=0.1
+                )
+                if signature_vector is not None:
+                    self.cache.add_vector(LLMCache.make_key(signature=signature), signature_vector, response_text)
+            
+            logger.info("   🤖 LLM analysis received (%s characters)", len(response_text))
+            
+            analysis = _require_keys(_json_loads(response_text), {'column_semantics': dict}, "CSV analysis")
+            for col, details in analysis['column_semantics'].items():
+                _require_keys(details, {}, f"column_semantics[{col!r}]")
             
             analysis['file_path'] = csv_path
-            analysis['row_count'] = len(df)
+            analysis['row_count'] = total_rows
             analysis['column_count'] = len(df.columns)
+            analysis['column_samples'] = {detail["name"]: detail["sample_values"] for detail in column_details}
             
             # Log analysis results
-            print(f"✅ Semantic Analysis Complete:")
-            print(f"   🎯 Business purpose: {analysis.get('table_purpose', 'Unknown')}")
-            print(f"   📦 Identified source: {analysis.get('data_source', 'Unknown')}")
+            logger.info("✅ Semantic Analysis Complete:")
+            logger.info("   🎯 Business purpose: %s", analysis.get('table_purpose', 'Unknown'))
+            logger.info("   📦 Identified source: %s", analysis.get('data_source', 'Unknown'))
             
             if 'source_identification' in analysis:
                 platform = analysis['source_identification'].get('platform_confidence', 0)
                 export_type = analysis['source_identification'].get('export_type', 'unknown')
-                print(f"   🔍 Platform detection: {platform:.2f} confidence ({export_type})")
+                logger.info("   🔍 Platform detection: %.2f confidence (%s)", platform, export_type)
             
             if 'quality_assessment' in analysis:
                 completeness = analysis['quality_assessment'].get('overall_completeness', 'unknown')
                 consistency = analysis['quality_assessment'].get('data_consistency', 'unknown')
-                print(f"   📊 Data quality: {completeness} complete, {consistency} consistent")
+                logger.info("   📊 Data quality: %s complete, %s consistent", completeness, consistency)
             
             return analysis
             
         except Exception as e:
-            print(f"   ❌ LLM analysis failed: {e}")
+            logger.error("   ❌ LLM analysis failed: %s", e)
             raise RuntimeError(f"Cannot proceed without LLM analysis. Error: {e}")
     
     def create_ingestion_strategy(self, target_config: TableConfig, unknown_analysis: Dict) -> Dict[str, Any]:
         """Create strategy to ingest unknown CSV into target table structure"""
         
-        print(f"🧠 Creating field-by-field ingestion strategy...")
+        logger.info("🧠 Creating field-by-field ingestion strategy...")
         
         # Build target context
         target_context = self._build_target_context(target_config)
         
+        # Only the fields that inform the mapping are sent back to the LLM
+        source_columns = {
+            col: {key: details.get(key) for key in ("semantic_type", "description", "data_pattern")}
+            for col, details in unknown_analysis.get('column_semantics', {}).items()
+        }
+        
+        # Confident one-to-one matches come from embedding similarity; only the rest needs the LLM
+        embedding_strategies, candidates = self._match_columns_by_embedding(target_config, unknown_analysis)
+        remaining_columns = [col for col in target_config.get_enrichment_column_names() if col not in embedding_strategies]
+        logger.info("   🧭 Embedding match: %s mapped, %s left for the LLM", len(embedding_strategies), len(remaining_columns))
+        
+        already_mapped = "\n".join(
+            f"  - {target_col} <- {field_strategy['source_mapping'][0]}"
+            for target_col, field_strategy in embedding_strategies.items()
+        ) or "  (none)"
+        candidate_hints = "\n".join(
+            f"  - {target_col}: {source_col} (similarity {score:.2f})"
+            for target_col, (source_col, score) in candidates.items()
+        ) or "  (none)"
+        
         prompt = textwrap.dedent(f"""
             Create a detailed field-by-field ingestion strategy to map unknown CSV data into target table structure:
             
@@ -276,7 +848,7 @@ class AdaptiveMerger:
             Data Source: {unknown_analysis.get('data_source', 'unknown')}
             
             Source Column Details:
-            {json.dumps(unknown_analysis.get('column_semantics', {}), indent=2)}
+            {_json_dumps(source_columns)}
             
             For each target column, determine the best merge strategy. Available strategies:
             - "replace": Completely replace target column with mapped source column
@@ -286,63 +858,6 @@ class AdaptiveMerger:
             - "preserve": Keep existing target data, ignore source
             - "transform": Apply specific transformation (regex, format, etc.)
             
-            Create strategy in this JSON format:
-            {{
-                "field_strategies": {{
-                    "target_column_name": {{
-                        "strategy": "replace|prompt_merge|concat|derive|preserve|transform",
-                        "source_mapping": ["source_column1", "source_column2"],
-                        "confidence": 0.95,
-                        "reasoning": "why_this_strategy_was_chosen",
-                        "transformation_rule": "if_transform_strategy_what_rule_to_apply",
-                        "prompt_template": "if_prompt_merge_the_LLM_prompt_to_use",
-                        "fallback_strategy": "what_to_do_if_primary_strategy_fails"
-                    }}
-                }},
-                "unmapped_source_columns": {{
-                    "source_column": {{
-                        "reason": "why_this_column_was_not_mapped",
-                        "potential_use": "possible_future_use_for_this_data",
-                        "action": "ignore|store_as_metadata|create_new_target_column"
-                    }}
-                }},
-                "data_quality_rules": {{
-                    "deduplication": {{
-                        "strategy": "email_based|name_company_based|custom",
-                        "key_fields": ["fields_to_use_for_duplicate_detection"],
-                        "resolution": "prefer_target|prefer_source|merge_both"
-                    }},
-                    "validation": {{
-                        "email_validation": true,
-                        "phone_formatting": true,
-                        "name_standardization": true
-                    }},
-                    "cleanup": {{
-                        "trim_whitespace": true,
-                        "standardize_formats": true,
-                        "handle_nulls": "preserve|replace_with_empty|skip"
-                    }}
-                }},
-                "ingestion_plan": {{
-                    "processing_order": ["order_of_field_processing"],
-                    "conflict_resolution": "how_to_handle_data_conflicts",
-                    "error_handling": "continue|stop|log_and_continue",
-                    "validation_checks": ["checks_to_perform_after_ingestion"]
-                }},
-                "confidence_score": 0.92,
-                "risk_assessment": {{
-                    "data_loss_risk": "low|medium|high",
-                    "quality_impact": "positive|neutral|negative",
-                    "schema_compatibility": "excellent|good|fair|poor"
-                }},
-                "execution_summary": {{
-                    "total_fields_mapped": 5,
-                    "fields_requiring_llm": 2,
-                    "complex_transformations": 1,
-                    "estimated_processing_time": "fast|medium|slow"
-                }}
-            }}
-            
             Consider:
             - Target column descriptions and business requirements
             - Source data quality and semantic meaning
@@ -350,79 +865,192 @@ class AdaptiveMerger:
             - How to handle conflicts and missing data
             - Data validation and quality preservation
             
-            Return only valid JSON, no explanations.
+            These target columns are already mapped and must not appear in field_strategies:
+            {already_mapped}
+            
+            Create field strategies only for: {', '.join(remaining_columns)}
+            Likely source candidates for some of them:
+            {candidate_hints}
         """).strip()
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
-            )
-            
-            # Better error handling for API response
-            if not response.choices or not response.choices[0].message.content:
-                raise ValueError("Empty response from OpenAI API")
-            
-            response_text = response.choices[0].message.content.strip()
-            if not response_text:
-                raise ValueError("Empty content in OpenAI API response")
-            
-            print(f"   🤖 Strategy response received ({len(response_text)} characters)")
-            
-            # Strip markdown code blocks if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]  # Remove ```json
-            if response_text.startswith('```'):
-                response_text = response_text[3:]  # Remove ```
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]  # Remove trailing ```
-            response_text = response_text.strip()
-            
-            try:
-                strategy = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                print(f"   ❌ Failed to parse strategy response as JSON: {e}")
-                print(f"   📝 Raw response: {response_text[:200]}...")
-                raise ValueError(f"Invalid JSON response from LLM: {e}")
+            if remaining_columns or not embedding_strategies:
+                response_text = self._cached_completion(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format=STRATEGY_RESPONSE_FORMAT,
+                    temperature=0.1
+                )
+                
+                logger.info("   🤖 Strategy response received (%s characters)", len(response_text))
+                
+                strategy = _require_keys(_json_loads(response_text), {'field_strategies': dict}, "Ingestion strategy")
+                for target_col, field_strategy in strategy['field_strategies'].items():
+                    _require_keys(field_strategy, {'strategy': str, 'source_mapping': list}, f"field_strategies[{target_col!r}]")
+                strategy['field_strategies'].update(embedding_strategies)
+            else:
+                logger.info("   ⚡ All target columns matched by embeddings, skipping LLM strategy call")
+                strategy = self._build_embedding_strategy(embedding_strategies, unknown_analysis)
             
             # Log strategy summary
             if 'field_strategies' in strategy:
-                print(f"   📋 Field mapping strategies:")
+                logger.info("   📋 Field mapping strategies:")
                 for target_col, field_strategy in strategy['field_strategies'].items():
                     strategy_type = field_strategy.get('strategy', 'unknown')
                     confidence = field_strategy.get('confidence', 0)
-                    print(f"      • {target_col}: {strategy_type} (confidence: {confidence:.2f})")
+                    logger.debug("      • %s: %s (confidence: %.2f)", target_col, strategy_type, confidence)
             
             if 'unmapped_source_columns' in strategy:
                 unmapped_count = len(strategy['unmapped_source_columns'])
                 if unmapped_count > 0:
-                    print(f"   ⚠️  {unmapped_count} source columns will not be mapped")
+                    logger.warning("   ⚠️  %s source columns will not be mapped", unmapped_count)
             
             overall_confidence = strategy.get('confidence_score', 0)
-            print(f"   🎯 Overall strategy confidence: {overall_confidence:.2f}")
+            logger.info("   🎯 Overall strategy confidence: %.2f", overall_confidence)
             
             return strategy
             
         except Exception as e:
-            print(f"   ❌ Strategy creation failed: {e}")
+            logger.error("   ❌ Strategy creation failed: %s", e)
             raise RuntimeError(f"Cannot proceed without LLM strategy. Error: {e}")
     
+    def _cached_completion(self, **request) -> str:
+        """Chat completion whose response text is cached by a hash of the request"""
+        
+        key = LLMCache.make_key(**request)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("   ♻️  Using cached LLM response")
+                return cached
+        
+        response = self.client.chat.completions.create(**request)
+        
+        # Better error handling for API response
+        if not response.choices or not response.choices[0].message.content:
+            raise ValueError("Empty response from OpenAI API")
+        
+        response_text = response.choices[0].message.content.strip()
+        if not response_text:
+            raise ValueError("Empty content in OpenAI API response")
+        
+        if self.cache is not None:
+            self.cache.set(key, response_text)
+        return response_text
+    
+    def _embed(self, text: str) -> np.ndarray:
+        """Embed text for semantic cache lookups"""
+        return self._embed_many([text])[0]
+    
+    def _embed_many(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in a single request, reusing cached vectors"""
+        import numpy as np
+        
+        keys = [LLMCache.make_key(model=EMBEDDING_MODEL, input=text) for text in texts]
+        vectors = {}
+        if self.cache is not None:
+            for key in keys:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    vectors[key] = _json_loads(cached)
+        
+        missing = [(key, text) for key, text in zip(keys, texts) if key not in vectors]
+        if missing:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=[text for _, text in missing])
+            for (key, _), item in zip(missing, response.data):
+                vectors[key] = item.embedding
+                if self.cache is not None:
+                    self.cache.set(key, _json_dumps(item.embedding))
+        
+        return np.asarray([vectors[key] for key in keys], dtype=np.float32)
+    
+    def _match_columns_by_embedding(self, target_config: TableConfig, unknown_analysis: Dict) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Tuple[str, float]]]:
+        """Match target columns to source columns by cosine similarity of their embeddings
+        
+        Returns (replace strategies for confident one-to-one matches, best candidate for columns worth an LLM review)
+        """
+        import numpy as np
+        
+        target_columns = target_config.get_enrichment_column_names()
+        column_samples = unknown_analysis.get('column_samples', {})
+        source_columns = list(column_samples) or list(unknown_analysis.get('column_semantics', {}))
+        if not target_columns or not source_columns:
+            return {}, {}
+        
+        target_sigs = tuple(f"{col}: {target_config.get_enrichment_column_description(col)}" for col in target_columns)
+        source_sigs = [" | ".join([col] + [str(v) for v in column_samples.get(col, [])]) for col in source_columns]
+        
+        # Only the source side is embedded once this target schema has been seen
+        target_vectors = self._target_vectors.get(target_sigs)
+        texts = source_sigs if target_vectors is not None else list(target_sigs) + source_sigs
+        try:
+            vectors = _unit_rows(self._embed_many(texts))
+        except Exception as e:
+            logger.warning("   ⚠️  Embedding match unavailable (%s), using LLM for all columns", e)
+            return {}, {}
+        
+        if target_vectors is None:
+            target_vectors = self._target_vectors[target_sigs] = vectors[:len(target_sigs)]
+        # A zero-length embedding has similarity 0 to everything, so it never passes the thresholds
+        similarity = target_vectors @ vectors[-len(source_sigs):].T
+        best_sources = similarity.argmax(axis=1)
+        best_scores = similarity.max(axis=1)
+        # More than one confident source (first + last name for full_name, ...) needs concat/derive, not replace
+        multi_source = (similarity >= MAPPING_ACCEPT_SIMILARITY).sum(axis=1) > 1
+        
+        # Greedy one-to-one assignment, best score first: a source column already taken sends the target to review
+        matches = {}
+        candidates = {}
+        taken_sources = set()
+        for target_idx in np.argsort(-best_scores, kind='stable'):
+            target_col = target_columns[target_idx]
+            source_col = source_columns[best_sources[target_idx]]
+            score = float(best_scores[target_idx])
+            if score >= MAPPING_ACCEPT_SIMILARITY and not multi_source[target_idx] and source_col not in taken_sources:
+                taken_sources.add(source_col)
+                matches[target_col] = {
+                    "strategy": "replace",
+                    "source_mapping": [source_col],
+                    "confidence": round(score, 2),
+                    "reasoning": f"Embedding similarity {score:.2f} between target description and source column"
+                }
+            elif score >= MAPPING_REVIEW_SIMILARITY:
+                candidates[target_col] = (source_col, score)
+        
+        return matches, candidates
+    
+    def _build_embedding_strategy(self, field_strategies: Dict[str, Dict[str, Any]], unknown_analysis: Dict) -> Dict[str, Any]:
+        """Build a complete strategy when every target column was matched by embeddings"""
+        import numpy as np
+        
+        mapped_sources = {col for field_strategy in field_strategies.values() for col in field_strategy['source_mapping']}
+        source_columns = unknown_analysis.get('column_samples') or unknown_analysis.get('column_semantics', {})
+        
+        return {
+            "field_strategies": field_strategies,
+            "unmapped_source_columns": {
+                col: {"reason": "No target column matched this source column", "action": "ignore"}
+                for col in source_columns if col not in mapped_sources
+            },
+            "data_quality_rules": {"cleanup": {"trim_whitespace": True, "handle_nulls": "preserve"}},
+            "confidence_score": float(np.mean([fs['confidence'] for fs in field_strategies.values()]))
+        }
+    
     def _build_target_context(self, config: TableConfig) -> str:
         """Build detailed context for target table"""
         
-        context = f"Purpose: {config.purpose}\n"
-        context += f"Column Policy: {config.get_column_policy_text()}\n\n"
-        
-        context += "Target Column Specifications:\n"
+        parts = [
+            f"Purpose: {config.purpose}",
+            f"Column Policy: {config.get_column_policy_text()}",
+            "",
+            "Target Column Specifications:"
+        ]
         if isinstance(config.enrichment_columns, dict):
-            for col, desc in config.enrichment_columns.items():
-                context += f"  - {col}: {desc}\n"
+            parts.extend(f"  - {col}: {desc}" for col, desc in config.enrichment_columns.items())
         else:
-            for col in config.enrichment_columns:
-                context += f"  - {col}: Important field\n"
+            parts.extend(f"  - {col}: Important field" for col in config.enrichment_columns)
         
-        return context
+        return "\n".join(parts)
     
     def ingest_csv(self, yaml_config_file: str, csv_to_ingest: str) -> pd.DataFrame:
         """
@@ -435,330 +1063,470 @@ class AdaptiveMerger:
         Returns:
             DataFrame with ingested data mapped to target schema
         """
+        import pandas as pd
         
-        print("🚀 Starting intelligent CSV ingestion pipeline")
-        print(f"📋 Config: {yaml_config_file}")
-        print(f"📄 Input CSV: {csv_to_ingest}")
+        logger.info("🚀 Starting intelligent CSV ingestion pipeline")
+        logger.info("📋 Config: %s", yaml_config_file)
+        logger.info("📄 Input CSV: %s", csv_to_ingest)
         
         # Load target configuration from YAML
         if not Path(yaml_config_file).exists():
             raise FileNotFoundError(f"❌ YAML configuration file not found: {yaml_config_file}")
         
-        print(f"📝 Loading target schema configuration...")
+        logger.info("📝 Loading target schema configuration...")
         target_config = TableConfig.from_yaml(yaml_config_file)
-        print(f"   🎯 Purpose: {target_config.purpose[:80]}...")
-        print(f"   📊 Target columns: {len(target_config.get_enrichment_column_names())}")
-        print(f"   📜 Policy: {target_config.column_policy}")
+        logger.info("   🎯 Purpose: %s...", target_config.purpose[:80])
+        logger.info("   📊 Target columns: %s", len(target_config.get_enrichment_column_names()))
+        logger.info("   📜 Policy: %s", target_config.column_policy)
         
         # Get output file from YAML config
         output_file = target_config.target
         if not output_file:
             output_file = "ingested_data.csv"
-            print(f"   ⚠️  No target specified in YAML, using default: {output_file}")
+            logger.warning("   ⚠️  No target specified in YAML, using default: %s", output_file)
         else:
-            print(f"   📂 Target file: {output_file}")
-        
-        # Determine target table file (check if exists or create empty)
-        target_columns = target_config.get_enrichment_column_names()
-        target_table_file = f"target_table_temp.csv"
+            logger.info("   📂 Target file: %s", output_file)
         
         # Create empty target table structure
-        empty_target = pd.DataFrame(columns=target_columns)
-        empty_target.to_csv(target_table_file, index=False)
-        print(f"📋 Created target table structure with {len(target_columns)} columns")
+        target_columns = target_config.get_enrichment_column_names()
+        target_df = pd.DataFrame(columns=target_columns)
+        logger.info("📋 Created target table structure with %s columns", len(target_columns))
         
         # Analyze unknown CSV
-        print(f"🔍 Analyzing unknown CSV structure...")
+        logger.info("🔍 Analyzing unknown CSV structure...")
         unknown_analysis = self.analyze_unknown_csv(csv_to_ingest)
         
-        print(f"✅ CSV Analysis Complete:")
-        print(f"   📊 Purpose: {unknown_analysis.get('table_purpose', 'Unknown')}")
-        print(f"   📦 Source: {unknown_analysis.get('data_source', 'Unknown')}")
-        print(f"   📋 Input columns: {unknown_analysis.get('column_count', 0)}")
-        print(f"   📈 Input rows: {unknown_analysis.get('row_count', 0)}")
+        logger.info("✅ CSV Analysis Complete:")
+        logger.info("   📊 Purpose: %s", unknown_analysis.get('table_purpose', 'Unknown'))
+        logger.info("   📦 Source: %s", unknown_analysis.get('data_source', 'Unknown'))
+        logger.info("   📋 Input columns: %s", unknown_analysis.get('column_count', 0))
+        logger.info("   📈 Input rows: %s", unknown_analysis.get('row_count', 0))
         
         # Create ingestion strategy
-        print(f"🧠 Creating intelligent field-mapping strategy...")
+        logger.info("🧠 Creating intelligent field-mapping strategy...")
         strategy = self.create_ingestion_strategy(target_config, unknown_analysis)
         
         strategy_confidence = strategy.get('confidence_score', 0)
         field_count = len(strategy.get('field_strategies', {}))
         unmapped_count = len(strategy.get('unmapped_source_columns', {}))
         
-        print(f"✅ Strategy Created:")
-        print(f"   🎯 Overall confidence: {strategy_confidence:.2f}")
-        print(f"   🗺️  Target fields mapped: {field_count}")
-        print(f"   ⚠️  Source columns unmapped: {unmapped_count}")
+        logger.info("✅ Strategy Created:")
+        logger.info("   🎯 Overall confidence: %.2f", strategy_confidence)
+        logger.info("   🗺️  Target fields mapped: %s", field_count)
+        logger.info("   ⚠️  Source columns unmapped: %s", unmapped_count)
         
         # Execute ingestion
-        print(f"🔀 Executing intelligent field-by-field ingestion...")
-        ingested_df = self.execute_ingestion(target_table_file, csv_to_ingest, strategy, target_config)
-        
-        # Clean up temporary file
-        if Path(target_table_file).exists():
-            os.remove(target_table_file)
+        logger.info("🔀 Executing intelligent field-by-field ingestion...")
+        ingested_df = self.execute_ingestion(target_df, csv_to_ingest, strategy, target_config, output_file)
         
-        # Save result to target specified in YAML
-        ingested_df.to_csv(output_file, index=False)
-        print(f"💾 Results saved to: {output_file}")
+        logger.info("💾 Results saved to: %s", output_file)
         
         final_rows = len(ingested_df)
         final_cols = len(ingested_df.columns)
         
-        print(f"✅ Ingestion Pipeline Complete!")
-        print(f"   📊 Final output: {final_rows} rows × {final_cols} columns")
-        print(f"   🎯 Schema compliance: Target structure maintained")
-        print(f"   📈 Success rate: {strategy_confidence:.1%}")
+        logger.info("✅ Ingestion Pipeline Complete!")
+        logger.info("   📊 Final output: %s rows × %s columns", final_rows, final_cols)
+        logger.info("   🎯 Schema compliance: Target structure maintained")
+        logger.info("   📈 Success rate: %.1f%%", strategy_confidence * 100)
         
         return ingested_df
     
-    def execute_ingestion(self, target_table: str, unknown_csv: str, 
-                         strategy: Dict[str, Any], target_config: TableConfig) -> pd.DataFrame:
-        """Execute the ingestion strategy with detailed field-by-field processing"""
+    def execute_ingestion(self, target_df: pd.DataFrame, unknown_csv: str, 
+                         strategy: Dict[str, Any], target_config: TableConfig,
+                         output_file: Optional[str] = None, collect_result: bool = True) -> Optional[pd.DataFrame]:
+        """Execute the ingestion strategy with detailed field-by-field processing
+        
+        The source CSV is streamed in chunks of INGEST_CHUNK_ROWS rows; when output_file
+        is given, each processed chunk is appended to it as soon as it is ready. With
+        collect_result=False only the current chunk is held in memory and None is returned.
+        """
+        import pandas as pd
+        
+        if not collect_result and not output_file:
+            raise ValueError("collect_result=False needs an output_file to write the chunks to")
+        
+        logger.info("🔧 Field-by-Field Processing Engine Starting...")
+        
+        logger.info("   📊 Target structure: %s rows, %s columns", len(target_df), len(target_df.columns))
+        
+        result_chunks = []
+        output_columns = None
+        rows_consumed = 0
+        rows_written = 0
+        populated_columns = set()
+        
+        def _emit(rows: pd.DataFrame, first: bool):
+            """Append processed rows to output_file and/or the collected result, tracking the summary stats"""
+            nonlocal rows_written
+            if output_file:
+                rows.to_csv(output_file, mode='w' if first else 'a', header=first, index=False)
+            if collect_result:
+                result_chunks.append(rows)
+            rows_written += len(rows)
+            populated_columns.update(rows.columns[rows.notna().any()])
+        
+        # Read raw text so every chunk gets the same dtypes regardless of the values it happens to hold
+        source_chunks = pd.read_csv(unknown_csv, chunksize=INGEST_CHUNK_ROWS, dtype=self.string_dtype)
+        for chunk_number, source_df in enumerate(source_chunks):
+            # Repeated values (industry, country, ...) cost an int code per row while the chunk is processed
+            source_df = source_df.reset_index(drop=True)
+            source_df = _encode_categoricals(source_df, list(source_df.columns), CATEGORICAL_MAX_UNIQUE_RATIO)
+            logger.info("   📊 Source chunk %s: %s rows, %s columns", chunk_number + 1, len(source_df), len(source_df.columns))
+            
+            # Target rows are aligned positionally with the source rows of this chunk
+            chunk_target = target_df.iloc[rows_consumed:rows_consumed + len(source_df)].reset_index(drop=True)
+            rows_consumed += len(source_df)
+            
+            chunk_result = self._process_source_chunk(chunk_target, source_df, strategy)
+            
+            # Keep the column layout of the first chunk so appended chunks line up
+            if output_columns is None:
+                output_columns = list(chunk_result.columns)
+            else:
+                chunk_result = chunk_result.reindex(columns=output_columns)
+            _emit(chunk_result, first=chunk_number == 0)
         
-        print(f"🔧 Field-by-Field Processing Engine Starting...")
+        if output_columns is None:
+            # No source chunks at all: the target is kept as it is
+            output_columns = list(target_df.columns)
+            _emit(target_df.copy(), first=True)
+        elif rows_consumed < len(target_df):
+            # Target rows beyond the end of the source are kept as they are
+            _emit(target_df.iloc[rows_consumed:].reindex(columns=output_columns), first=False)
         
-        # Load data
-        if Path(target_table).exists():
-            target_df = pd.read_csv(target_table)
-            print(f"   📊 Target structure: {len(target_df)} rows, {len(target_df.columns)} columns")
-        else:
-            print(f"   📊 Target structure: Creating new schema")
-            target_df = pd.DataFrame()
+        logger.info("✅ Field Processing Complete:")
+        logger.info("   📊 Output dimensions: %s rows × %s columns", rows_written, len(output_columns))
+        logger.info("   📈 Populated fields: %s/%s", len(populated_columns), len(output_columns))
+        logger.info("   🎯 Schema compliance: Target structure maintained")
+        
+        if not collect_result:
+            return None
         
-        source_df = pd.read_csv(unknown_csv)
-        print(f"   📊 Source data: {len(source_df)} rows, {len(source_df.columns)} columns")
+        result_df = pd.concat(result_chunks, ignore_index=True)
+        
+        # Title-cased names repeat a lot; decide on categoricals once for the whole result so every chunk shares a dtype
+        if strategy.get('data_quality_rules', {}).get('validation', {}).get('name_standardization'):
+            result_df = _encode_categoricals(result_df, _name_columns(result_df), NAME_CATEGORICAL_MAX_UNIQUE_RATIO)
+        
+        return result_df
+    
+    def _process_source_chunk(self, target_df: pd.DataFrame, source_df: pd.DataFrame,
+                              strategy: Dict[str, Any]) -> pd.DataFrame:
+        """Apply field strategies, unmapped-column handling and quality rules to one source chunk"""
+        import pandas as pd
         
         # Process each target field according to its strategy
         field_strategies = strategy.get('field_strategies', {})
         result_df = target_df.copy() if not target_df.empty else pd.DataFrame()
         
         total_fields = len(field_strategies)
-        print(f"   🎯 Processing {total_fields} target schema fields...")
+        logger.info("   🎯 Processing %s target schema fields...", total_fields)
+        
+        # Give every field the full chunk length up front so each handler only produces its own column
+        result_df = _align_length(result_df, len(source_df))
         
-        processed_fields = 0
-        for target_col, field_strategy in field_strategies.items():
-            processed_fields += 1
+        source_columns = set(source_df.columns)
+        compute_fields, llm_fields = [], []
+        for processed_fields, (target_col, field_strategy) in enumerate(field_strategies.items(), 1):
             strategy_type = field_strategy.get('strategy', 'unknown')
             source_mapping = field_strategy.get('source_mapping', [])
-            confidence = field_strategy.get('confidence', 0)
-            reasoning = field_strategy.get('reasoning', 'No reasoning provided')
             
-            print(f"\n   [{processed_fields}/{total_fields}] Processing: {target_col}")
-            print(f"      🎯 Strategy: {strategy_type}")
-            print(f"      📈 Confidence: {confidence:.2f}")
-            print(f"      🧠 Reasoning: {reasoning[:60]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("   [%s/%s] Processing: %s", processed_fields, total_fields, target_col)
+                logger.debug("      🎯 Strategy: %s", strategy_type)
+                logger.debug("      📈 Confidence: %.2f", field_strategy.get('confidence', 0))
+                logger.debug("      🧠 Reasoning: %s...", field_strategy.get('reasoning', 'No reasoning provided')[:60])
             
             if source_mapping:
-                print(f"      🔗 Source mapping: {source_mapping}")
+                logger.debug("      🔗 Source mapping: %s", source_mapping)
                 
                 # Check if source columns exist
-                available_sources = [col for col in source_mapping if col in source_df.columns]
+                available_sources = [col for col in source_mapping if col in source_columns]
                 if not available_sources:
-                    print(f"      ❌ No mapped source columns found - preserving existing")
+                    logger.warning("      ❌ No mapped source columns found - preserving existing")
                     continue
                 
-                print(f"      ✅ Available sources: {available_sources}")
-                
-                # Apply the specific strategy
-                try:
-                    if strategy_type == "replace":
-                        result_df = self._apply_replace_strategy(result_df, source_df, target_col, available_sources[0])
-                    
-                    elif strategy_type == "prompt_merge":
-                        prompt_template = field_strategy.get('prompt_template', '')
-                        result_df = self._apply_prompt_merge_strategy(result_df, source_df, target_col, available_sources, prompt_template)
-                    
-                    elif strategy_type == "concat":
-                        result_df = self._apply_concat_strategy(result_df, source_df, target_col, available_sources)
-                    
-                    elif strategy_type == "derive":
-                        transformation_rule = field_strategy.get('transformation_rule', '')
-                        result_df = self._apply_derive_strategy(result_df, source_df, target_col, available_sources, transformation_rule)
-                    
-                    elif strategy_type == "transform":
-                        transformation_rule = field_strategy.get('transformation_rule', '')
-                        result_df = self._apply_transform_strategy(result_df, source_df, target_col, available_sources[0], transformation_rule)
-                    
-                    elif strategy_type == "preserve":
-                        print(f"      ⏭️  Preserving existing data, ignoring source")
-                    
-                    else:
-                        print(f"      ⚠️  Unknown strategy '{strategy_type}', falling back to replace")
-                        result_df = self._apply_replace_strategy(result_df, source_df, target_col, available_sources[0])
-                        
-                    print(f"      ✅ Field processing complete")
-                    
-                except Exception as e:
-                    print(f"      ❌ Field processing failed: {e}")
-                    print(f"      🔄 Skipping field and continuing...")
+                logger.debug("      ✅ Available sources: %s", available_sources)
+                field = (target_col, available_sources, field_strategy)
+                (llm_fields if strategy_type in LLM_STRATEGIES else compute_fields).append(field)
             
             else:
-                print(f"      ⚠️  No source mapping defined - field will remain empty")
+                logger.warning("      ⚠️  No source mapping defined - field will remain empty")
+        
+        # Compute-bound handlers hold the GIL, so run them inline; overlap the LLM-bound ones
+        def _apply(field: Tuple[str, List[str], Dict[str, Any]]) -> Tuple[str, Optional[pd.Series]]:
+            return self._apply_field_strategy(result_df, source_df, *field)
+        
+        results = [_apply(field) for field in compute_fields]
+        if llm_fields:
+            logger.info("   🤖 Running %s LLM-bound fields concurrently...", len(llm_fields))
+            with ThreadPoolExecutor(max_workers=min(MAX_FIELD_CONCURRENCY, len(llm_fields))) as executor:
+                results.extend(executor.map(_apply, llm_fields))
+        
+        # Assign in schema order so new columns appear in the same order as the field strategies
+        columns = dict(results)
+        for target_col in field_strategies:
+            if columns.get(target_col) is not None:
+                result_df[target_col] = columns[target_col].set_axis(result_df.index)
         
         # Handle any unmapped source data
         unmapped_columns = strategy.get('unmapped_source_columns', {})
         if unmapped_columns:
-            print(f"\n   📦 Processing {len(unmapped_columns)} unmapped source columns:")
+            logger.info("   📦 Processing %s unmapped source columns:", len(unmapped_columns))
             for source_col, unmapped_info in unmapped_columns.items():
                 action = unmapped_info.get('action', 'ignore')
                 reason = unmapped_info.get('reason', 'No reason provided')
-                print(f"      • {source_col}: {action}")
-                print(f"        💭 Reason: {reason[:50]}...")
+                logger.debug("      • %s: %s", source_col, action)
+                logger.debug("        💭 Reason: %s...", reason[:50])
                 
-                if action == "store_as_metadata" and source_col in source_df.columns:
+                if action == "store_as_metadata" and source_col in source_columns:
                     # Add as additional column
-                    result_df[f"meta_{source_col}"] = source_df[source_col] if len(source_df) == len(result_df) else None
-                    print(f"        ✅ Stored as meta_{source_col}")
+                    result_df[f"meta_{source_col}"] = _decode_categoricals(source_df[[source_col]])[source_col] if len(source_df) == len(result_df) else None
+                    logger.debug("        ✅ Stored as meta_%s", source_col)
         
         # Apply data quality rules
         quality_rules = strategy.get('data_quality_rules', {})
         if quality_rules:
-            print(f"\n   🔍 Applying data quality rules...")
+            logger.info("   🔍 Applying data quality rules...")
             result_df = self._apply_quality_rules(result_df, quality_rules)
-            print(f"      ✅ Quality rules applied")
-        
-        final_rows = len(result_df)
-        final_cols = len(result_df.columns)
-        non_empty_cols = sum(1 for col in result_df.columns if result_df[col].notna().any())
-        
-        print(f"\n✅ Field Processing Complete:")
-        print(f"   📊 Output dimensions: {final_rows} rows × {final_cols} columns")
-        print(f"   📈 Populated fields: {non_empty_cols}/{final_cols}")
-        print(f"   🎯 Schema compliance: Target structure maintained")
+            logger.debug("      ✅ Quality rules applied")
         
         return result_df
     
-    def _apply_replace_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, 
-                               target_col: str, source_col: str) -> pd.DataFrame:
-        """Replace target column with source column data"""
+    def _apply_field_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                              source_cols: List[str], field_strategy: Dict[str, Any]) -> Tuple[str, Optional[pd.Series]]:
+        """Run one field's strategy handler on a private copy of its target column and return the new column"""
+        import pandas as pd
+        
+        strategy_type = field_strategy.get('strategy', 'unknown')
+        handler = self.strategy_handlers.get(strategy_type)
+        if handler is None:
+            logger.warning("      ⚠️  Unknown strategy '%s' for %s, falling back to replace", strategy_type, target_col)
+            handler = self._apply_replace_strategy
+        
+        # Handlers write into the frame they are given, so never hand them the shared one
+        if target_col in target_df.columns:
+            field_df = target_df[[target_col]].copy()
+        else:
+            field_df = pd.DataFrame(index=target_df.index)
+        
+        try:
+            field_df = handler(field_df, source_df, target_col, source_cols, field_strategy)
+        except Exception as e:
+            logger.warning("      ❌ Field processing failed for %s: %s", target_col, e)
+            logger.debug("      🔄 Skipping field and continuing...")
+            return target_col, None
+        
+        if target_col not in field_df.columns:
+            return target_col, None
+        logger.debug("      ✅ Field processing complete: %s", target_col)
+        return target_col, field_df[target_col]
+    
+    def _apply_replace_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                               source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
+        """Replace target column with the first source column's data"""
+        import numpy as np
+        import pandas as pd
+        
+        source_col = source_cols[0]
         
         if target_df.empty:
             # Start with empty dataframe but use source length
             target_df = pd.DataFrame(index=range(len(source_df)))
         
-        # Handle different row counts
-        if len(source_df) > len(target_df):
-            # Extend target_df to accommodate all source rows
-            additional_rows = len(source_df) - len(target_df)
-            empty_rows = pd.DataFrame([{col: None for col in target_df.columns}] * additional_rows)
-            target_df = pd.concat([target_df, empty_rows], ignore_index=True)
-        
-        # Now safely assign - truncate source if it's longer than target
-        source_values = source_df[source_col].values
-        if len(source_values) > len(target_df):
-            source_values = source_values[:len(target_df)]
-        elif len(source_values) < len(target_df):
+        # Extend target_df to accommodate all source rows
+        target_df = _align_length(target_df, len(source_df))
+        
+        # Now safely assign as one buffer write - pad if source is shorter than target
+        source_values = _decode_categoricals(source_df[[source_col]])[source_col].to_numpy(copy=False)
+        if len(source_values) < len(target_df):
             # Pad with None if source is shorter
             padded_values = np.full(len(target_df), None, dtype=object)
             padded_values[:len(source_values)] = source_values
             source_values = padded_values
         
         target_df[target_col] = source_values
-        non_null_count = pd.Series(source_values).notna().sum()
-        print(f"        ✅ Replaced with {source_col} ({non_null_count}/{len(source_values)} non-null values)")
+        non_null_count = int(pd.notna(source_values).sum())
+        logger.debug("        ✅ Replaced with %s (%s/%s non-null values)", source_col, non_null_count, len(source_values))
         return target_df
     
-    def _apply_prompt_merge_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame,
-                                    target_col: str, source_cols: List[str], prompt_template: str) -> pd.DataFrame:
+    def _apply_prompt_merge_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                                    source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
         """Use LLM to intelligently merge target and source data"""
+        prompt_template = field_strategy.get('prompt_template', '')
+        
+        # Extend target_df if needed
+        target_df = _align_length(target_df, len(source_df))
+        
+        # Build one JSON record per row: existing target value plus the mapped source values
+        source_records = _as_text(_decode_categoricals(source_df[source_cols]), self.string_dtype).to_dict('records')
+        if target_col in target_df.columns:
+            current_values = _as_text(target_df[target_col], self.string_dtype).tolist()
+        else:
+            current_values = [''] * len(target_df)
+        rows = [{"current": current_values[i], "source": source_records[i]} for i in range(len(source_records))]
+        
+        # Amortize the instructions over many rows per request
+        batches = [rows[i:i + PROMPT_MERGE_BATCH_SIZE] for i in range(0, len(rows), PROMPT_MERGE_BATCH_SIZE)]
+        prompts = [
+            textwrap.dedent(f"""
+                Merge data into the target column "{target_col}".
+                
+                Merge instructions: {prompt_template or 'Combine the current value and the source values into the best single value'}
+                
+                Each row has the existing target value ("current") and the mapped source values ("source"):
+                {_json_dumps(batch)}
+                
+                Return exactly {len(batch)} merged values, one per row, in the same order.
+            """).strip()
+            for batch in batches
+        ]
         
-        # For now, implement a simplified version - in production this would use LLM for each row
-        print(f"        🤖 Applying LLM merge strategy (using concat fallback)")
-        return self._apply_concat_strategy(target_df, source_df, target_col, source_cols)
+        logger.debug("        🤖 Applying LLM merge strategy (%s rows in %s batched requests)", len(rows), len(prompts))
+        
+        try:
+            merged_values = []
+            responses = self._llm_batch(prompts, response_format=PROMPT_MERGE_RESPONSE_FORMAT)
+            for batch, response_text in zip(batches, responses):
+                values = _require_keys(_json_loads(response_text), {'values': list}, "Merged values")['values']
+                if len(values) != len(batch):
+                    raise ValueError(f"expected {len(batch)} merged values, got {len(values)}")
+                merged_values.extend(values)
+        except Exception as e:
+            logger.warning("        ⚠️  LLM merge failed (%s), using concat fallback", e)
+            return self._apply_concat_strategy(target_df, source_df, target_col, source_cols, field_strategy)
+        
+        target_df[target_col] = merged_values
+        logger.debug("        ✅ LLM merged %s columns into %s values", len(source_cols), len(merged_values))
+        return target_df
     
-    def _apply_concat_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame,
-                              target_col: str, source_cols: List[str]) -> pd.DataFrame:
-        """Concatenate target and source values"""
+    def _llm_batch(self, prompts: List[str], model: str = "gpt-4o-mini",
+                   response_format: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Run independent completions concurrently, retrying each with exponential backoff
         
-        if target_df.empty:
-            target_df = pd.DataFrame()
+        At most MAX_LLM_CONCURRENCY requests are in flight process-wide, however many fields call this at once.
+        """
+        
+        request = {"model": model, "temperature": 0.1}
+        if response_format:
+            request["response_format"] = response_format
         
+        def _complete(prompt: str) -> str:
+            for attempt in range(LLM_MAX_RETRIES):
+                try:
+                    # Hold a slot only for the request itself, not for the backoff sleep
+                    with _LLM_REQUEST_SLOTS:
+                        response = self.client.chat.completions.create(
+                            messages=[{"role": "user", "content": prompt}],
+                            **request
+                        )
+                    return response.choices[0].message.content or ""
+                except Exception:
+                    if attempt == LLM_MAX_RETRIES - 1:
+                        raise
+                    time.sleep(2 ** attempt)  # 1s, 2s, ...
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_LLM_CONCURRENCY, len(prompts)))) as executor:
+            return list(executor.map(_complete, prompts))
+    
+    def _apply_concat_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                              source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
+        """Concatenate target and source values"""
         # Extend target_df if needed
-        if len(source_df) > len(target_df):
-            additional_rows = len(source_df) - len(target_df)
-            empty_rows = pd.DataFrame([{col: None for col in target_df.columns}] * additional_rows)
-            target_df = pd.concat([target_df, empty_rows], ignore_index=True)
+        target_df = _align_length(target_df, len(source_df))
         
         # Concatenate source columns
-        source_combined = source_df[source_cols].fillna('').astype(str).agg(' '.join, axis=1)
+        source_combined = self._join_columns(source_df[source_cols])
         
         if target_col in target_df.columns:
             # Combine with existing data
-            existing_data = target_df[target_col].fillna('').astype(str)
+            existing_data = _as_text(target_df[target_col], self.string_dtype)
             target_df[target_col] = (existing_data + ' | ' + source_combined).str.strip(' |')
         else:
             target_df[target_col] = source_combined
         
-        non_empty_count = target_df[target_col].str.strip().ne('').sum()
-        print(f"        ✅ Concatenated {len(source_cols)} columns ({non_empty_count} non-empty results)")
+        non_empty_count = int((target_df[target_col].str.strip().to_numpy() != '').sum())
+        logger.debug("        ✅ Concatenated %s columns (%s non-empty results)", len(source_cols), non_empty_count)
         return target_df
     
-    def _apply_derive_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame,
-                              target_col: str, source_cols: List[str], transformation_rule: str) -> pd.DataFrame:
+    def _join_columns(self, df: pd.DataFrame) -> pd.Series:
+        """Join df's columns row-wise with spaces on the configured backend"""
+        df = _decode_categoricals(df)
+        if self.backend == "polars":
+            joined = _join_columns_polars(df, dtype=self.string_dtype)
+            if joined is not None:
+                return joined
+            logger.debug("Polars is not installed, joining columns with pandas")
+        return _join_columns(df, dtype=self.string_dtype)
+    
+    def _apply_derive_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                              source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
         """Derive new values by combining multiple source columns"""
-        
-        if target_df.empty:
-            target_df = pd.DataFrame()
+        transformation_rule = field_strategy.get('transformation_rule', '')
         
         # Extend target_df if needed
-        if len(source_df) > len(target_df):
-            additional_rows = len(source_df) - len(target_df)
-            empty_rows = pd.DataFrame([{col: None for col in target_df.columns}] * additional_rows)
-            target_df = pd.concat([target_df, empty_rows], ignore_index=True)
+        target_df = _align_length(target_df, len(source_df))
         
         # Apply derivation logic (simplified - could be enhanced with more rules)
         if "first_last_name" in transformation_rule.lower() and len(source_cols) >= 2:
-            first_name = source_df[source_cols[0]].fillna('')
-            last_name = source_df[source_cols[1]].fillna('')
-            target_df[target_col] = (first_name + ' ' + last_name).str.strip()
+            target_df[target_col] = self._join_columns(source_df[source_cols[:2]]).str.strip()
             complete_names = target_df[target_col].str.strip().ne('').sum()
-            print(f"        ✅ Derived full names from {source_cols[0]} + {source_cols[1]} ({complete_names} complete)")
+            logger.debug("        ✅ Derived full names from %s + %s (%s complete)", source_cols[0], source_cols[1], complete_names)
         else:
             # Default: concatenate with space
-            derived_values = source_df[source_cols].fillna('').astype(str).agg(' '.join, axis=1)
+            derived_values = self._join_columns(source_df[source_cols])
             target_df[target_col] = derived_values
-            non_empty_count = derived_values.str.strip().ne('').sum()
-            print(f"        ✅ Derived from {len(source_cols)} columns ({non_empty_count} non-empty)")
+            non_empty_count = int((derived_values.str.strip().to_numpy() != '').sum())
+            logger.debug("        ✅ Derived from %s columns (%s non-empty)", len(source_cols), non_empty_count)
         
         return target_df
     
-    def _apply_transform_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame,
-                                 target_col: str, source_col: str, transformation_rule: str) -> pd.DataFrame:
-        """Apply specific transformation to source data"""
-        
-        if target_df.empty:
-            target_df = pd.DataFrame()
+    def _apply_transform_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                                 source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
+        """Apply specific transformation to the first source column's data"""
+        source_col = source_cols[0]
+        transformation_rule = field_strategy.get('transformation_rule', '')
         
         # Extend target_df if needed
-        if len(source_df) > len(target_df):
-            additional_rows = len(source_df) - len(target_df)
-            empty_rows = pd.DataFrame([{col: None for col in target_df.columns}] * additional_rows)
-            target_df = pd.concat([target_df, empty_rows], ignore_index=True)
+        target_df = _align_length(target_df, len(source_df))
         
         source_data = source_df[source_col]
         original_count = source_data.notna().sum()
         
-        # Apply transformations based on rules
-        if "lowercase" in transformation_rule.lower():
-            transformed_data = source_data.astype(str).str.lower()
-            print(f"        ✅ Applied lowercase transformation ({original_count} values)")
-        elif "standardize_email" in transformation_rule.lower():
-            transformed_data = source_data.astype(str).str.strip().str.lower()
-            print(f"        ✅ Applied email standardization ({original_count} values)")
-        elif "format_phone" in transformation_rule.lower():
-            # Basic phone formatting
-            transformed_data = source_data.astype(str).str.replace(r'[^\d]', '', regex=True)
-            print(f"        ✅ Applied phone formatting ({original_count} values)")
+        # Apply the first transform named in the rule
+        rule = transformation_rule.lower()
+        transform_name = next((name for name in self.transforms if name in rule), None)
+        if transform_name:
+            # Categorical sources are transformed once per distinct value
+            transformed_data = _map_categories(source_data, self.transforms[transform_name])
+            logger.debug("        ✅ Applied %s transformation (%s values)", transform_name, original_count)
         else:
-            transformed_data = source_data
-            print(f"        ⚠️  No specific transformation rule applied ({original_count} values)")
+            transformed_data = _decode_categoricals(source_df[[source_col]])[source_col]
+            logger.warning("        ⚠️  No specific transformation rule applied (%s values)", original_count)
         
-        target_df[target_col] = transformed_data.values[:len(target_df)]
+        values = transformed_data.array
+        if len(values) != len(target_df):
+            values = values[:len(target_df)]
+        target_df[target_col] = values
+        return target_df
+    
+    def _format_phone(self, data: pd.Series) -> pd.Series:
+        """Strip everything but digits from phone numbers"""
+        digits = _digits_only(data, self.string_dtype)
+        if digits is None:
+            digits = _ensure_string_dtype(data, self.string_dtype).str.replace(NON_DIGIT_PATTERN, '', regex=True)
+        return digits
+    
+    def _apply_preserve_strategy(self, target_df: pd.DataFrame, source_df: pd.DataFrame, target_col: str,
+                                source_cols: List[str], field_strategy: Dict[str, Any]) -> pd.DataFrame:
+        """Keep existing target data, ignoring the source"""
+        
+        logger.debug("      ⏭️  Preserving existing data, ignoring source")
         return target_df
     
     def _apply_quality_rules(self, df: pd.DataFrame, quality_rules: Dict) -> pd.DataFrame:
         """Apply data quality rules to the final dataframe"""
+        import numpy as np
         
         validation = quality_rules.get('validation', {})
         cleanup = quality_rules.get('cleanup', {})
@@ -767,63 +1535,66 @@ class AdaptiveMerger:
         
         # Email validation
         if validation.get('email_validation') and 'email' in df.columns:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            valid_emails = df['email'].str.match(email_pattern, na=False)
+            emails = _ensure_string_dtype(df['email'], self.string_dtype)
+            email_regex = EMAIL_PATTERN if getattr(emails.dtype, 'storage', None) == 'pyarrow' else EMAIL_RE
+            valid_emails = emails.str.match(email_regex, na=False)
             invalid_count = (~valid_emails).sum()
             total_emails = df['email'].notna().sum()
             if invalid_count > 0:
-                print(f"      📧 Email validation: {total_emails - invalid_count}/{total_emails} valid addresses")
+                logger.debug("      📧 Email validation: %s/%s valid addresses", total_emails - invalid_count, total_emails)
             else:
-                print(f"      ✅ Email validation: All {total_emails} addresses valid")
+                logger.debug("      ✅ Email validation: All %s addresses valid", total_emails)
             rules_applied += 1
         
         # Phone formatting
         if validation.get('phone_formatting') and 'phone' in df.columns:
             phone_count = df['phone'].notna().sum()
-            print(f"      📞 Phone formatting applied to {phone_count} numbers")
+            logger.debug("      📞 Phone formatting applied to %s numbers", phone_count)
             rules_applied += 1
         
         # Name standardization
+        name_columns = []
         if validation.get('name_standardization'):
-            name_columns = [col for col in df.columns if 'name' in col.lower()]
+            name_columns = _name_columns(df)
             if name_columns:
-                for col in name_columns:
-                    df[col] = df[col].astype(str).str.title()
-                print(f"      👤 Name standardization applied to {len(name_columns)} columns")
+                df[name_columns] = df[name_columns].astype(self.string_dtype).apply(lambda col: col.str.title())
+                logger.debug("      👤 Name standardization applied to %s columns", len(name_columns))
                 rules_applied += 1
         
         # Whitespace cleanup
         if cleanup.get('trim_whitespace'):
-            text_columns = df.select_dtypes(include=['object']).columns
-            for col in text_columns:
-                df[col] = df[col].astype(str).str.strip()
-            print(f"      🧹 Whitespace trimmed from {len(text_columns)} text columns")
+            text_columns = df.select_dtypes(include=['object', 'string']).columns
+            if len(text_columns):
+                df[text_columns] = df[text_columns].astype(self.string_dtype).apply(lambda col: col.str.strip())
+            logger.debug("      🧹 Whitespace trimmed from %s text columns", len(text_columns))
             rules_applied += 1
         
         # Format standardization
         if cleanup.get('standardize_formats'):
-            print(f"      📐 Format standardization applied")
+            logger.debug("      📐 Format standardization applied")
             rules_applied += 1
         
         # Handle nulls
         null_handling = cleanup.get('handle_nulls', 'preserve')
         if null_handling == 'replace_with_empty':
-            null_count = df.isnull().sum().sum()
-            df = df.fillna('')
-            print(f"      🔄 Replaced {null_count} null values with empty strings")
+            null_count = int(np.count_nonzero(df.isna().to_numpy()))
+            # Only text columns can hold ''; numeric columns keep NaN rather than turning into objects
+            text_columns = df.select_dtypes(include=['object', 'string']).columns
+            df[text_columns] = df[text_columns].fillna('')
+            logger.debug("      🔄 Replaced %s null values with empty strings", null_count)
             rules_applied += 1
         elif null_handling == 'skip':
             initial_rows = len(df)
             df = df.dropna()
             removed_rows = initial_rows - len(df)
             if removed_rows > 0:
-                print(f"      🗑️  Removed {removed_rows} rows with null values")
+                logger.debug("      🗑️  Removed %s rows with null values", removed_rows)
             rules_applied += 1
         
         if rules_applied == 0:
-            print(f"      ℹ️  No quality rules specified to apply")
+            logger.debug("      ℹ️  No quality rules specified to apply")
         else:
-            print(f"      ✅ Applied {rules_applied} data quality rules")
+            logger.debug("      ✅ Applied %s data quality rules", rules_applied)
         
         return df
     
@@ -831,13 +1602,16 @@ class AdaptiveMerger:
                           enrichment_columns: Union[List[str], Dict[str, str]] = None,
                           column_policy: str = "balanced") -> TableConfig:
         """Helper to create and save a table configuration"""
+        import pandas as pd
         
+        table_file = Path(table_path)
         if enrichment_columns is None:
-            if Path(table_path).exists():
-                df = pd.read_csv(table_path)
+            if table_file.exists():
+                # Only the header is needed - parse no rows
+                columns = pd.read_csv(table_file, nrows=0).columns
                 # Create enhanced format with column descriptions
                 enrichment_columns = {}
-                for col in list(df.columns[:5]):
+                for col in list(columns[:5]):
                     enrichment_columns[col] = f"Key business field: {col}"
             else:
                 # Default customer structure
@@ -864,14 +1638,14 @@ class AdaptiveMerger:
         )
         
         # Save configuration
-        config_path = f"{Path(table_path).stem}_config.yaml"
+        config_path = f"{table_file.stem}_config.yaml"
         config.to_yaml(config_path)
         
-        print(f"📝 Created configuration file: {config_path}")
-        print(f"📋 Format: Enhanced with column descriptions")
-        print(f"🎯 Enrichment columns: {len(enrichment_columns)} specified")
-        print(f"📜 Column policy: {column_policy}")
-        print(f"📂 Target file: {table_path}")
+        logger.info("📝 Created configuration file: %s", config_path)
+        logger.info("📋 Format: Enhanced with column descriptions")
+        logger.info("🎯 Enrichment columns: %s specified", len(enrichment_columns))
+        logger.info("📜 Column policy: %s", column_policy)
+        logger.info("📂 Target file: %s", table_path)
         return config
 
 def main():
@@ -900,6 +1674,9 @@ Key Features:
         """)
         sys.exit(1)
     
+    # Pipeline progress goes through logging; INTABULAR_LOG_LEVEL=DEBUG adds per-field detail
+    logging.basicConfig(level=os.getenv('INTABULAR_LOG_LEVEL', 'INFO').upper(), format='%(message)s')
+    
     command_or_yaml = sys.argv[1]
     merger = AdaptiveMerger()
     
@@ -1,20 +1,21 @@
-import pandas as pd
-
 def create_test_subset():
-    # Load the original CSV file
-    df = pd.read_csv('data/target_with_emails.csv')
+    import pandas as pd
     
-    print(f"Original dataset shape: {df.shape}")
-    print(f"First 10 rows preview:")
-    print(df.head(10))
+    # Parse only the rows we keep; count the rest as raw lines without building a DataFrame
+    source_file = 'data/target_with_emails.csv'
+    test_df = pd.read_csv(source_file, nrows=10)
+    with open(source_file, 'rb') as f:
+        total_rows = sum(1 for _ in f) - 1
     
-    # Take first 10 rows
-    test_df = df.head(10)
+    print(f"Original dataset shape: {(total_rows, test_df.shape[1])}")
+    print(f"First 10 rows preview:")
+    print(test_df)
     
-    # Save to a new test file
-    test_df.to_csv('data/target_with_emails_test10.csv', index=False)
+    # Save to a new test file through one large binary buffer with plain '\n' line endings
+    with open('data/target_with_emails_test10.csv', 'wb', buffering=1 << 20) as f:
+        test_df.to_csv(f, index=False, lineterminator='\n')
     
     print(f"\nTest subset saved to 'data/target_with_emails_test10.csv' with shape: {test_df.shape}")
 
 if __name__ == "__main__":
-    create_test_subset() 
\ No newline at end of file
+    create_test_subset()
@@ -1,21 +1,28 @@
-import pandas as pd
 import json
-from intabular.core.config import GatekeeperConfig
-from intabular.core.analyzer import DataframeAnalyzer
-from intabular.core.strategy import DataframeIngestionStrategy
-from intabular.main import setup_llm_client
+from functools import lru_cache
 
-def debug_strategy_creation():
-    """Debug why company_name gets 'none' transformation type"""
-    
-    # Load the same data and config as the test
-    config = GatekeeperConfig.from_yaml('test/data/configs/customer_crm.yaml')
-    df = pd.read_csv('test/data/csv/perfect_match.csv')
+@lru_cache(maxsize=4)
+def _get_components(config_path, csv_path):
+    """Load config and data and build the LLM-backed components once per input pair"""
+    # pandas and the intabular core (which pulls in the OpenAI SDK) load on first use, not on import
+    import pandas as pd
+    from intabular.core.config import GatekeeperConfig
+    from intabular.core.analyzer import DataframeAnalyzer
+    from intabular.core.strategy import DataframeIngestionStrategy
+    from intabular.main import setup_llm_client
     
-    # Setup the same components as the test
+    config = GatekeeperConfig.from_yaml(config_path)
+    df = pd.read_csv(csv_path)
     client = setup_llm_client()
-    analyzer = DataframeAnalyzer(client, config)
-    strategy_creator = DataframeIngestionStrategy(client)
+    return config, df, DataframeAnalyzer(client, config), DataframeIngestionStrategy(client)
+
+def debug_strategy_creation(config_path='test/data/configs/customer_crm.yaml',
+                            csv_path='test/data/csv/perfect_match.csv'):
+    """Debug why company_name gets 'none' transformation type"""
+    
+    # Load the same data and config as the test and set up the same components,
+    # reusing them when called again for the same inputs
+    config, df, analyzer, strategy_creator = _get_components(config_path, csv_path)
     
     # Analyze the dataframe
     print("=== ANALYZING DATAFRAME ===")
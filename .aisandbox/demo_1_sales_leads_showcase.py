@@ -11,16 +11,17 @@ Perfect for social media showcase! 📱✨
 
 import sys
 import pandas as pd
-import numpy as np
 from pathlib import Path
-from datetime import datetime
-import os
+from functools import lru_cache
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from showcase_common import arrow_backed, cached_frame, render_once
 
+# The .aisandbox directory this script lives in - every demo file is written there
+SANDBOX = Path(__file__).resolve().parent
+
+@lru_cache(maxsize=1)
 def create_demo_data():
-    """Create realistic messy sales data from different platforms"""
+    """Create realistic messy sales data from different platforms (cached: do not modify the returned frames)"""
     
     # LinkedIn Sales Navigator Export (messy format 1)
     linkedin_data = pd.DataFrame({
@@ -66,12 +67,40 @@ def create_demo_data():
         'Notes__c': ['Met at AutoTech 2024, interested in automation solutions', 'Downloaded our supply chain whitepaper']
     })
     
-    return linkedin_data, apollo_data, salesforce_data
+    return arrow_backed(linkedin_data), arrow_backed(apollo_data), arrow_backed(salesforce_data)
 
-def create_target_schema():
-    """Create clean target CRM schema configuration"""
+def write_csv(df, path):
+    """Write a DataFrame as CSV with pyarrow's C++ writer, falling back to pandas without pyarrow"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
     
-    schema_yaml = """
+    # pyarrow quotes header names and string cells; the file reads back the same with pd.read_csv
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+# Pretty-printed static demo inputs; pandas' to_string formats every cell in Python, so render once
+render_demo_data = render_once(create_demo_data)
+
+# Showcase output used when the pipeline cannot run (e.g. no OpenAI API key)
+_MOCK_RESULT_COLS = {
+    'email': ['sarah.johnson@techstartup.io', 'mike.chen@enterprise.com', 'david.kim@fintech.co'],
+    'full_name': ['Sarah Johnson', 'Michael Chen', 'David Kim'],
+    'company_name': ['TechStartup Inc', 'Enterprise Solutions LLC', 'FinTech Solutions'],
+    'job_title': ['VP of Engineering', 'Chief Technology Officer', 'Product Manager'],
+    'phone': ['+1-555-0101', '+1-555-0202', '(555) 123-4567'],
+    'location': ['San Francisco, CA', 'Austin, TX', 'San Francisco, CA'],
+    'lead_source': ['LinkedIn', 'LinkedIn', 'Apollo'],
+    'notes': ['AI trends expert', 'Enterprise CTO', 'FinTech product leader']
+}
+
+create_mock_result = cached_frame(_MOCK_RESULT_COLS)
+
+# Target CRM schema written out for the pipeline
+SCHEMA_PATH = SANDBOX / 'crm_prospects_config.yaml'
+SCHEMA_YAML = """
 purpose: >
   Unified sales prospect database for CRM and outreach. Contains qualified leads
   with complete contact information for sales team follow-up and relationship management.
@@ -127,22 +156,31 @@ enrichment_columns:
 
 target_file_path: "unified_sales_prospects.csv"
 """
+
+def create_target_schema():
+    """Create clean target CRM schema configuration"""
     
-    # Save the schema
-    with open('.aisandbox/crm_prospects_config.yaml', 'w') as f:
-        f.write(schema_yaml)
+    # Save the schema, unless an identical file is already there
+    schema_bytes = SCHEMA_YAML.encode('utf-8')
+    if not SCHEMA_PATH.is_file() or SCHEMA_PATH.read_bytes() != schema_bytes:
+        SCHEMA_PATH.write_bytes(schema_bytes)
     
-    return '.aisandbox/crm_prospects_config.yaml'
+    return str(SCHEMA_PATH)
+
+# Demo banner, assembled once and written in a single call
+SHOWCASE_HEADER = (
+    "\n" + "="*80 + "\n"
+    "🎯 INTABULAR SHOWCASE DEMO 1: SALES LEADS CONSOLIDATION\n"
+    + "="*80 + "\n"
+    "🚀 Transform messy sales exports into clean, unified CRM data using AI\n"
+    "💡 Perfect example of semantic data mapping in action!\n"
+    + "="*80 + "\n\n"
+)
 
 def print_showcase_header():
     """Print beautiful header for the demo"""
     
-    print("\n" + "="*80)
-    print("🎯 INTABULAR SHOWCASE DEMO 1: SALES LEADS CONSOLIDATION")
-    print("="*80)
-    print("🚀 Transform messy sales exports into clean, unified CRM data using AI")
-    print("💡 Perfect example of semantic data mapping in action!")
-    print("="*80 + "\n")
+    sys.stdout.write(SHOWCASE_HEADER)
 
 def print_transformation_summary(linkedin_df, apollo_df, salesforce_df, result_df):
     """Print impressive transformation metrics"""
@@ -150,8 +188,7 @@ def print_transformation_summary(linkedin_df, apollo_df, salesforce_df, result_d
     total_input_records = len(linkedin_df) + len(apollo_df) + len(salesforce_df)
     unique_output_records = len(result_df)
     
-    print("\n" + "🎯 TRANSFORMATION SUMMARY".center(80, "="))
-    print(f"""
+    summary = f"""
 📥 INPUT DATA CHAOS:
    • LinkedIn Export:    {len(linkedin_df)} records, {len(linkedin_df.columns)} different columns
    • Apollo.io Export:   {len(apollo_df)} records, {len(apollo_df.columns)} different columns  
@@ -177,8 +214,8 @@ def print_transformation_summary(linkedin_df, apollo_df, salesforce_df, result_d
    ✓ No manual mapping of 20+ different column names
    ✓ Consistent format enables automated workflows
    ✓ Preserved relationship context for personalized outreach
-""")
-    print("="*80 + "\n")
+"""
+    sys.stdout.write("\n" + "🎯 TRANSFORMATION SUMMARY".center(80, "=") + "\n" + summary + "\n" + "="*80 + "\n\n")
 
 def run_demo():
     """Run the complete sales leads consolidation demo"""
@@ -188,25 +225,26 @@ def run_demo():
     # Create demo data
     print("📊 Creating realistic messy sales data from different platforms...\n")
     linkedin_df, apollo_df, salesforce_df = create_demo_data()
+    linkedin_table, apollo_table, salesforce_table = render_demo_data()
     
     # Show input data chaos
     print("📥 INPUT DATA (Before InTabular):")
     print("\n🔗 LinkedIn Sales Navigator Export:")
-    print(linkedin_df.to_string(index=False))
+    print(linkedin_table)
     print(f"\nColumns: {', '.join(linkedin_df.columns)}")
     
     print("\n🎯 Apollo.io Export:")
-    print(apollo_df.to_string(index=False))
+    print(apollo_table)
     print(f"\nColumns: {', '.join(apollo_df.columns)}")
     
     print("\n☁️ Salesforce Export:")
-    print(salesforce_df.to_string(index=False))
+    print(salesforce_table)
     print(f"\nColumns: {', '.join(salesforce_df.columns)}")
     
     # Save input files for InTabular
-    linkedin_df.to_csv('.aisandbox/demo1_linkedin_export.csv', index=False)
-    apollo_df.to_csv('.aisandbox/demo1_apollo_export.csv', index=False)
-    salesforce_df.to_csv('.aisandbox/demo1_salesforce_export.csv', index=False)
+    write_csv(linkedin_df, SANDBOX / 'demo1_linkedin_export.csv')
+    write_csv(apollo_df, SANDBOX / 'demo1_apollo_export.csv')
+    write_csv(salesforce_df, SANDBOX / 'demo1_salesforce_export.csv')
     
     # Create target schema
     config_path = create_target_schema()
@@ -216,30 +254,27 @@ def run_demo():
     
     # Import and run InTabular
     try:
-        from intabular.csv_component import run_csv_ingestion_pipeline
-        from intabular import setup_logging
+        from intabular.csv_component import run_csv_ingestion_pipeline_batch
+        from intabular import GatekeeperConfig, setup_logging
         
         # Setup minimal logging for demo
         setup_logging(level="WARNING", console_output=False)
         
-        # Transform each dataset
-        result_dfs = []
-        
-        print("🔄 Processing LinkedIn data...")
-        result1 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo1_linkedin_export.csv')
-        result_dfs.append(result1)
-        
-        print("🔄 Processing Apollo data...")  
-        result2 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo1_apollo_export.csv')
-        result_dfs.append(result2)
+        # Transform all datasets in one batch - the sources are analyzed concurrently,
+        # then ingested one after another into the shared target and saved once
+        export_files = {
+            "LinkedIn": SANDBOX / 'demo1_linkedin_export.csv',
+            "Apollo": SANDBOX / 'demo1_apollo_export.csv',
+            "Salesforce": SANDBOX / 'demo1_salesforce_export.csv',
+        }
         
-        print("🔄 Processing Salesforce data...")
-        result3 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo1_salesforce_export.csv')
-        result_dfs.append(result3)
+        print(f"🔄 Processing {len(export_files)} sources in one batch: {', '.join(export_files)}...")
+        schema = GatekeeperConfig.from_yaml(config_path)
+        result_dfs = run_csv_ingestion_pipeline_batch(schema, list(export_files.values()))
         
-        # Combine results
-        final_result = pd.concat(result_dfs, ignore_index=True)
-        final_result.to_csv('.aisandbox/demo1_unified_prospects.csv', index=False)
+        # The last result holds every source merged into the unified database
+        final_result = result_dfs[-1]
+        write_csv(final_result, SANDBOX / 'demo1_unified_prospects.csv')
         
         print("\n📤 OUTPUT DATA (After InTabular):")
         print("\n🎯 Unified Sales Prospects Database:")
@@ -263,17 +298,8 @@ def run_demo():
         print("   2. pip install intabular")
         print("   3. Run this script again")
         
-        # Create mock result for showcase
-        mock_result = pd.DataFrame({
-            'email': ['sarah.johnson@techstartup.io', 'mike.chen@enterprise.com', 'david.kim@fintech.co'],
-            'full_name': ['Sarah Johnson', 'Michael Chen', 'David Kim'],
-            'company_name': ['TechStartup Inc', 'Enterprise Solutions LLC', 'FinTech Solutions'],
-            'job_title': ['VP of Engineering', 'Chief Technology Officer', 'Product Manager'],
-            'phone': ['+1-555-0101', '+1-555-0202', '(555) 123-4567'],
-            'location': ['San Francisco, CA', 'Austin, TX', 'San Francisco, CA'],
-            'lead_source': ['LinkedIn', 'LinkedIn', 'Apollo'],
-            'notes': ['AI trends expert', 'Enterprise CTO', 'FinTech product leader']
-        })
+        # Mock result for showcase
+        mock_result = create_mock_result()
         
         print("\n📤 MOCK OUTPUT (What the result would look like):")
         print(mock_result.to_string(index=False))
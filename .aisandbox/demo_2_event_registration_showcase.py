@@ -9,68 +9,90 @@ mapped to a unified attendee database for event management.
 Perfect for social media showcase! 📱✨
 """
 
-import sys
 import pandas as pd
-import numpy as np
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
 import os
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from showcase_common import arrow_backed, cached_frame, render_once
 
+# The .aisandbox directory this script lives in - every demo file is written there
+SANDBOX = Path(__file__).resolve().parent
+
+# Eventbrite Export
+_EVENTBRITE_COLS = {
+    'Order #': ['EB001', 'EB002', 'EB003', 'EB004'],
+    'First Name': ['Emma', 'John', 'Maria', 'David'],
+    'Last Name': ['Wilson', 'Smith', 'Garcia', 'Brown'],
+    'Email Address': ['emma.wilson@design.co', 'j.smith@marketing.com', 'maria.garcia@startup.io', 'david.brown@consulting.biz'],
+    'Phone Number': ['555-0001', '(555) 000-2222', '555.000.3333', '+1-555-000-4444'],
+    'Company Name': ['Design Studios', 'Marketing Pro', 'Tech Startup Inc', 'Brown Consulting'],
+    'Job Title': ['UX Designer', 'Marketing Director', 'Founder & CEO', 'Senior Consultant'],
+    'Ticket Type': ['VIP', 'Standard', 'Standard', 'Early Bird'],
+    'Registration Date': ['2024-01-15', '2024-01-18', '2024-01-20', '2024-01-22'],
+    'Dietary Requirements': ['Vegetarian', '', 'Vegan', 'No restrictions'],
+    'T-Shirt Size': ['M', 'L', 'S', 'XL']
+}
+
+# Zoom Webinar Registration
+_ZOOM_COLS = {
+    'Registration ID': ['ZM1001', 'ZM1002', 'ZM1003'],
+    'Attendee Email': ['alex.johnson@tech.org', 'sarah.davis@education.edu', 'mike.taylor@finance.com'],
+    'Full Name': ['Alex Johnson', 'Dr. Sarah Davis', 'Michael Taylor'],
+    'Organization': ['TechOrg Solutions', 'State University', 'Finance Corp'],
+    'Position': ['Software Engineer', 'Professor', 'Financial Analyst'],
+    'Industry': ['Technology', 'Education', 'Finance'],
+    'Registration Time': ['2024-01-16 14:30:00', '2024-01-19 09:15:00', '2024-01-21 16:45:00'],
+    'Source': ['LinkedIn Ad', 'University Website', 'Email Campaign'],
+    'Questions': ['Interested in AI applications', 'Researching EdTech trends', 'Looking for automation tools'],
+    'Phone': ['555-1001', '555-1002', '555-1003']
+}
+
+# Manual CSV Upload (conference networking)
+_NETWORK_COLS = {
+    'contact_email': ['lisa.chen@healthcare.org', 'robert.kim@manufacturing.com'],
+    'name': ['Lisa Chen, MD', 'Robert Kim'],
+    'company': ['Healthcare Innovations', 'Kim Manufacturing'],
+    'role': ['Chief Medical Officer', 'Operations Manager'],
+    'location': ['Boston, MA', 'Detroit, MI'], 
+    'networking_interests': ['Medical AI, Healthcare IT', 'Industry 4.0, Automation'],
+    'contact_phone': ['617-555-7890', '313-555-6789'],
+    'referred_by': ['Dr. Martinez', 'Tech Conference 2023'],
+    'session_preferences': ['Healthcare Track', 'Manufacturing Track'],
+    'special_needs': ['', 'Wheelchair accessible seating']
+}
+
+# Showcase output used when the pipeline cannot run (e.g. no OpenAI API key)
+_MOCK_RESULT_COLS = {
+    'email': ['emma.wilson@design.co', 'alex.johnson@tech.org', 'lisa.chen@healthcare.org'],
+    'full_name': ['Emma Wilson', 'Alex Johnson', 'Lisa Chen'],
+    'company': ['Design Studios', 'TechOrg Solutions', 'Healthcare Innovations'],
+    'job_title': ['UX Designer', 'Software Engineer', 'Chief Medical Officer'],
+    'phone': ['555-0001', '555-1001', '617-555-7890'],
+    'industry': ['Design', 'Technology', 'Healthcare'],
+    'registration_type': ['VIP', 'Webinar', 'Networking'],
+    'location': ['San Francisco, CA', 'Austin, TX', 'Boston, MA'],
+    'special_requirements': ['Vegetarian', '', ''],
+    'networking_interests': ['Design trends, UX innovation', 'AI applications', 'Medical AI, Healthcare IT']
+}
+
+create_mock_result = cached_frame(_MOCK_RESULT_COLS)
+
+@lru_cache(maxsize=1)
 def create_demo_data():
-    """Create realistic messy event registration data"""
-    
-    # Eventbrite Export
-    eventbrite_data = pd.DataFrame({
-        'Order #': ['EB001', 'EB002', 'EB003', 'EB004'],
-        'First Name': ['Emma', 'John', 'Maria', 'David'],
-        'Last Name': ['Wilson', 'Smith', 'Garcia', 'Brown'],
-        'Email Address': ['emma.wilson@design.co', 'j.smith@marketing.com', 'maria.garcia@startup.io', 'david.brown@consulting.biz'],
-        'Phone Number': ['555-0001', '(555) 000-2222', '555.000.3333', '+1-555-000-4444'],
-        'Company Name': ['Design Studios', 'Marketing Pro', 'Tech Startup Inc', 'Brown Consulting'],
-        'Job Title': ['UX Designer', 'Marketing Director', 'Founder & CEO', 'Senior Consultant'],
-        'Ticket Type': ['VIP', 'Standard', 'Standard', 'Early Bird'],
-        'Registration Date': ['2024-01-15', '2024-01-18', '2024-01-20', '2024-01-22'],
-        'Dietary Requirements': ['Vegetarian', '', 'Vegan', 'No restrictions'],
-        'T-Shirt Size': ['M', 'L', 'S', 'XL']
-    })
-    
-    # Zoom Webinar Registration
-    zoom_data = pd.DataFrame({
-        'Registration ID': ['ZM1001', 'ZM1002', 'ZM1003'],
-        'Attendee Email': ['alex.johnson@tech.org', 'sarah.davis@education.edu', 'mike.taylor@finance.com'],
-        'Full Name': ['Alex Johnson', 'Dr. Sarah Davis', 'Michael Taylor'],
-        'Organization': ['TechOrg Solutions', 'State University', 'Finance Corp'],
-        'Position': ['Software Engineer', 'Professor', 'Financial Analyst'],
-        'Industry': ['Technology', 'Education', 'Finance'],
-        'Registration Time': ['2024-01-16 14:30:00', '2024-01-19 09:15:00', '2024-01-21 16:45:00'],
-        'Source': ['LinkedIn Ad', 'University Website', 'Email Campaign'],
-        'Questions': ['Interested in AI applications', 'Researching EdTech trends', 'Looking for automation tools'],
-        'Phone': ['555-1001', '555-1002', '555-1003']
-    })
-    
-    # Manual CSV Upload (conference networking)
-    networking_data = pd.DataFrame({
-        'contact_email': ['lisa.chen@healthcare.org', 'robert.kim@manufacturing.com'],
-        'name': ['Lisa Chen, MD', 'Robert Kim'],
-        'company': ['Healthcare Innovations', 'Kim Manufacturing'],
-        'role': ['Chief Medical Officer', 'Operations Manager'],
-        'location': ['Boston, MA', 'Detroit, MI'], 
-        'networking_interests': ['Medical AI, Healthcare IT', 'Industry 4.0, Automation'],
-        'contact_phone': ['617-555-7890', '313-555-6789'],
-        'referred_by': ['Dr. Martinez', 'Tech Conference 2023'],
-        'session_preferences': ['Healthcare Track', 'Manufacturing Track'],
-        'special_needs': ['', 'Wheelchair accessible seating']
-    })
-    
-    return eventbrite_data, zoom_data, networking_data
+    """Create realistic messy event registration data (built once; callers must not modify the frames)"""
+    return tuple(arrow_backed(pd.DataFrame(cols)) for cols in (_EVENTBRITE_COLS, _ZOOM_COLS, _NETWORK_COLS))
 
-def create_event_schema():
-    """Create unified event attendee schema"""
-    
-    schema_yaml = """
+def format_preview(df, max_rows=20, max_colwidth=40):
+    """Render at most max_rows rows with long cells cut short - to_string formats every cell it is given"""
+    return df.head(max_rows).to_string(index=False, max_colwidth=max_colwidth)
+
+# Previews of the static demo inputs, rendered once
+render_demo_data = render_once(create_demo_data, format_preview)
+
+# Unified event schema written out for the pipeline, kept as the bytes that go to disk
+SCHEMA_PATH = SANDBOX / 'event_attendees_config.yaml'
+SCHEMA_YAML = b"""
 purpose: >
   Unified event attendee database for conference management, networking, and follow-up.
   Contains complete attendee information for event logistics, personalized experiences,
@@ -139,11 +161,17 @@ enrichment_columns:
 
 target_file_path: "unified_event_attendees.csv"
 """
+
+def create_event_schema():
+    """Create unified event attendee schema"""
     
-    with open('.aisandbox/event_attendees_config.yaml', 'w') as f:
-        f.write(schema_yaml)
+    # Leave an identical schema alone; otherwise write a temp file and swap it in atomically
+    if not SCHEMA_PATH.is_file() or SCHEMA_PATH.read_bytes() != SCHEMA_YAML:
+        tmp_path = SCHEMA_PATH.with_name(SCHEMA_PATH.name + '.tmp')
+        tmp_path.write_bytes(SCHEMA_YAML)
+        os.replace(tmp_path, SCHEMA_PATH)
     
-    return '.aisandbox/event_attendees_config.yaml'
+    return str(SCHEMA_PATH)
 
 def print_showcase_header():
     """Print beautiful header for demo 2"""
@@ -199,25 +227,26 @@ def run_demo():
     # Create demo data
     print("📊 Creating realistic event registration data from multiple sources...\n")
     eventbrite_df, zoom_df, networking_df = create_demo_data()
+    eventbrite_table, zoom_table, networking_table = render_demo_data()
     
     # Show input data chaos
     print("📥 INPUT REGISTRATIONS (Before InTabular):")
     print("\n🎫 Eventbrite Export:")
-    print(eventbrite_df.to_string(index=False))
+    print(eventbrite_table)
     print(f"\nColumns: {', '.join(eventbrite_df.columns)}")
     
     print("\n💻 Zoom Webinar Export:")
-    print(zoom_df.to_string(index=False))
+    print(zoom_table)
     print(f"\nColumns: {', '.join(zoom_df.columns)}")
     
     print("\n📝 Manual CSV Upload:")
-    print(networking_df.to_string(index=False))
+    print(networking_table)
     print(f"\nColumns: {', '.join(networking_df.columns)}")
     
     # Save input files
-    eventbrite_df.to_csv('.aisandbox/demo2_eventbrite_export.csv', index=False)
-    zoom_df.to_csv('.aisandbox/demo2_zoom_export.csv', index=False)
-    networking_df.to_csv('.aisandbox/demo2_networking_upload.csv', index=False)
+    eventbrite_df.to_csv(SANDBOX / 'demo2_eventbrite_export.csv', index=False)
+    zoom_df.to_csv(SANDBOX / 'demo2_zoom_export.csv', index=False)
+    networking_df.to_csv(SANDBOX / 'demo2_networking_upload.csv', index=False)
     
     # Create schema
     config_path = create_event_schema()
@@ -227,34 +256,32 @@ def run_demo():
     
     # Run transformation
     try:
-        from intabular.csv_component import run_csv_ingestion_pipeline
-        from intabular import setup_logging
+        from intabular.csv_component import run_csv_ingestion_pipeline_batch
+        from intabular import GatekeeperConfig, setup_logging
         
         # Setup minimal logging
         setup_logging(level="WARNING", console_output=False)
         
-        # Transform each dataset
-        result_dfs = []
-        
-        print("🔄 Processing Eventbrite registrations...")
-        result1 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo2_eventbrite_export.csv')
-        result_dfs.append(result1)
-        
-        print("🔄 Processing Zoom webinar registrations...")  
-        result2 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo2_zoom_export.csv')
-        result_dfs.append(result2)
+        # Transform all datasets in one batch - the LLM client and schema are set up once,
+        # the three sources are analyzed concurrently and then ingested into one target
+        registration_files = {
+            "Eventbrite registrations": SANDBOX / 'demo2_eventbrite_export.csv',
+            "Zoom webinar registrations": SANDBOX / 'demo2_zoom_export.csv',
+            "manual networking uploads": SANDBOX / 'demo2_networking_upload.csv',
+        }
         
-        print("🔄 Processing manual networking uploads...")
-        result3 = run_csv_ingestion_pipeline(config_path, '.aisandbox/demo2_networking_upload.csv')
-        result_dfs.append(result3)
+        print(f"🔄 Processing {len(registration_files)} sources in one batch: {', '.join(registration_files)}...")
+        # Parse the schema once and hand the loaded config to the pipeline
+        schema = GatekeeperConfig.from_yaml(config_path)
+        result_dfs = run_csv_ingestion_pipeline_batch(schema, list(registration_files.values()))
         
-        # Combine results
-        final_result = pd.concat(result_dfs, ignore_index=True)
-        final_result.to_csv('.aisandbox/demo2_unified_attendees.csv', index=False)
+        # The last result holds every source merged into the unified database
+        final_result = result_dfs[-1]
+        final_result.to_csv(SANDBOX / 'demo2_unified_attendees.csv', index=False)
         
         print("\n📤 OUTPUT DATA (After InTabular):")
         print("\n🎪 Unified Event Attendees Database:")
-        print(final_result.to_string(index=False))
+        print(format_preview(final_result))
         
         # Print transformation summary
         print_transformation_summary(eventbrite_df, zoom_df, networking_df, final_result)
@@ -270,22 +297,11 @@ def run_demo():
     except Exception as e:
         print(f"❌ Demo failed (likely missing OpenAI API key): {e}")
         
-        # Create mock result for showcase
-        mock_result = pd.DataFrame({
-            'email': ['emma.wilson@design.co', 'alex.johnson@tech.org', 'lisa.chen@healthcare.org'],
-            'full_name': ['Emma Wilson', 'Alex Johnson', 'Lisa Chen'],
-            'company': ['Design Studios', 'TechOrg Solutions', 'Healthcare Innovations'],
-            'job_title': ['UX Designer', 'Software Engineer', 'Chief Medical Officer'],
-            'phone': ['555-0001', '555-1001', '617-555-7890'],
-            'industry': ['Design', 'Technology', 'Healthcare'],
-            'registration_type': ['VIP', 'Webinar', 'Networking'],
-            'location': ['San Francisco, CA', 'Austin, TX', 'Boston, MA'],
-            'special_requirements': ['Vegetarian', '', ''],
-            'networking_interests': ['Design trends, UX innovation', 'AI applications', 'Medical AI, Healthcare IT']
-        })
+        # Mock result for showcase
+        mock_result = create_mock_result()
         
         print("\n📤 MOCK OUTPUT (What the result would look like):")
-        print(mock_result.to_string(index=False))
+        print(format_preview(mock_result))
         
         return mock_result
 
@@ -4,10 +4,6 @@ Demo script to test the lead parser with the Apollo CSV file.
 This script is for testing/debugging purposes only.
 """
 
-import sys
-import os
-sys.path.append('..')
-
 from lead_parser import LeadParser
 
 def main():
@@ -54,29 +50,60 @@ def main():
                 
                 def parse_csv(self, file_path):
                     from lead_parser import LeadData
+                    import numpy as np
                     import pandas as pd
                     
                     analysis = self.analyze_csv_structure(file_path)
                     
                     # Read CSV
                     df = pd.read_csv(file_path)
-                    leads = []
                     
                     # Process first 5 rows for demo
-                    for i, (_, row) in enumerate(df.head(5).iterrows()):
+                    sample = df.head(5)
+                    
+                    def column(name):
+                        """One field for every sampled row; a missing column reads as ''"""
+                        if name in sample.columns:
+                            return sample[name].to_numpy(dtype=object)
+                        return np.full(len(sample), '', dtype=object)
+                    
+                    # Research notes over 50 characters count as personalization data; measure the whole column at once
+                    if 'CustomAIResearchBasic' in sample.columns:
+                        research_len = sample['CustomAIResearchBasic'].fillna('').astype(str).str.len()
+                        personalization_mask = (research_len > 50).to_numpy()
+                    else:
+                        personalization_mask = np.zeros(len(sample), dtype=bool)
+                    
+                    # Normalize emails for the whole column up front: missing -> '', trimmed and lowercased
+                    if 'Email' in sample.columns:
+                        emails = sample['Email'].fillna('').astype(str).str.strip().str.lower().to_numpy(dtype=object)
+                    else:
+                        emails = column('Email')
+                    
+                    # Work field by field (one array per LeadData attribute) and drop rows without an email in one mask
+                    has_email = emails != ''
+                    fields = {
+                        'email': emails,
+                        'first_name': column('First Name'),
+                        'last_name': column('Last Name'),
+                        'company': column('Company'),
+                        'title': column('Title'),
+                        'linkedin_url': column('Person Linkedin Url'),
+                        'has_personalization_data': personalization_mask,
+                    }
+                    fields = {name: values[has_email] for name, values in fields.items()}
+                    
+                    # Only the kept rows become LeadData objects, each filled from a dict of its field values
+                    leads = []
+                    for values in zip(*fields.values()):
+                        row = dict(zip(fields, values))
+                        row['has_personalization_data'] = bool(row['has_personalization_data'])
                         lead = LeadData()
-                        lead.email = row.get('Email', '')
-                        lead.first_name = row.get('First Name', '')
-                        lead.last_name = row.get('Last Name', '')
-                        lead.company = row.get('Company', '')
-                        lead.title = row.get('Title', '')
-                        lead.linkedin_url = row.get('Person Linkedin Url', '')
-                        lead.enrichment_platforms = ['apollo']
-                        lead.has_personalization_data = len(str(row.get('CustomAIResearchBasic', ''))) > 50
+                        for name, value in row.items():
+                            setattr(lead, name, value)
                         lead.needs_enrichment = not lead.has_personalization_data
-                        
-                        if lead.email:
-                            leads.append(lead)
+                        lead.enrichment_platforms = ['apollo']
+                        leads.append(lead)
                     
                     return leads, analysis
                 
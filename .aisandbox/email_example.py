@@ -3,12 +3,12 @@
 Example script showing how to use send_emails.py as a module.
 """
 
-from send_emails import send_emails_from_csv
-
 def send_target_emails():
     """Send emails from target_with_emails.csv with custom column mapping."""
     
     try:
+        from send_emails import send_emails_from_csv
+        
         # Example 1: Using target_with_emails.csv with custom column mapping
         result = send_emails_from_csv(
             csv_file='target_with_emails.csv',
@@ -30,6 +30,8 @@ def send_custom_emails():
     """Example with custom CSV and column-based subjects/attachments."""
     
     try:
+        from send_emails import send_emails_from_csv
+        
         # Example 2: Custom CSV with column-based subjects and attachments
         result = send_emails_from_csv(
             csv_file='custom_emails.csv',
@@ -52,6 +54,8 @@ def send_simple_emails():
     """Simple example with minimal configuration."""
     
     try:
+        from send_emails import send_emails_from_csv
+        
         # Example 3: Simple usage with auto-detection
         result = send_emails_from_csv(
             csv_file='simple_emails.csv',
@@ -4,12 +4,8 @@ Enhanced demo showing the power of semantic table merging.
 Creates more realistic tables with varying schemas and naming conventions.
 """
 
-import sys
-import os
 import pandas as pd
-sys.path.append('..')
 
-from adaptive_merger import AdaptiveMerger, TableConfig, MergePolicy
 
 def create_realistic_tables():
     """Create realistic tables with different schemas"""
@@ -57,6 +53,8 @@ def create_realistic_tables():
 def create_semantic_configs():
     """Create semantic configurations for realistic tables"""
     
+    from adaptive_merger import TableConfig, MergePolicy
+    
     # CRM configuration - focus on customer lifecycle and deals
     crm_config = TableConfig(
         purpose="Customer relationship management system. Contains qualified customers, their contact information, and active deal pipeline. This is the authoritative source for customer data and should be prioritized in merges.",
@@ -89,8 +87,9 @@ def demo_semantic_intelligence():
     crm_file, marketing_file = create_realistic_tables()
     create_semantic_configs()
     
-    # Initialize merger
+    # Initialize merger (imported here so loading this module stays cheap)
     print("\n🔧 Initializing merger...")
+    from adaptive_merger import AdaptiveMerger
     merger = AdaptiveMerger()
     
     # Show what we're merging
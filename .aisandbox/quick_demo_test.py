@@ -7,74 +7,61 @@ Shows the beautiful data transformation visualization without needing API keys
 Perfect for social media showcase screenshots!
 """
 
-import sys
-import pandas as pd
-from pathlib import Path
+# Demo tables are static, so they are rendered once at import; quick_demo() only writes text
+_LINKEDIN_COLS = {
+    'contact_email': ('sarah@startup.io', 'mike@enterprise.com'),
+    'contact_name': ('Sarah Johnson', 'Mike Chen'),
+    'contact_company': ('TechStartup Inc', 'Enterprise LLC'),
+    'job_title': ('VP Engineering', 'CTO'),
+    'mobile': ('+1-555-0101', '+1-555-0202')
+}
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_APOLLO_COLS = {
+    'Email': ('david@fintech.co', 'lisa@healthtech.org'),
+    'First Name': ('David', 'Lisa'),
+    'Last Name': ('Kim', 'Wong'),
+    'Company': ('FinTech Solutions', 'HealthTech Inc'),
+    'Title': ('Product Manager', 'Marketing Head'),
+    'Phone Number': ('555-123-4567', '555-987-6543')
+}
 
-def quick_demo():
-    """Run a quick demo showing transformation visualization"""
-    
-    print("\n" + "="*80)
-    print("🎯 INTABULAR QUICK SHOWCASE: SALES DATA TRANSFORMATION")
-    print("="*80)
-    print("🚀 AI-powered semantic data mapping in action!")
-    print("="*80 + "\n")
-    
-    # Create messy input data
-    print("📥 MESSY INPUT DATA (Before InTabular):")
-    print("\n🔗 LinkedIn Export:")
-    linkedin_df = pd.DataFrame({
-        'contact_email': ['sarah@startup.io', 'mike@enterprise.com'],
-        'contact_name': ['Sarah Johnson', 'Mike Chen'],
-        'contact_company': ['TechStartup Inc', 'Enterprise LLC'],
-        'job_title': ['VP Engineering', 'CTO'],
-        'mobile': ['+1-555-0101', '+1-555-0202']
-    })
-    print(linkedin_df.to_string(index=False))
-    print(f"\nColumns: {', '.join(linkedin_df.columns)}")
-    
-    print("\n🎯 Apollo Export:")
-    apollo_df = pd.DataFrame({
-        'Email': ['david@fintech.co', 'lisa@healthtech.org'],
-        'First Name': ['David', 'Lisa'],
-        'Last Name': ['Kim', 'Wong'],
-        'Company': ['FinTech Solutions', 'HealthTech Inc'],
-        'Title': ['Product Manager', 'Marketing Head'],
-        'Phone Number': ['555-123-4567', '555-987-6543']
-    })
-    print(apollo_df.to_string(index=False))
-    print(f"\nColumns: {', '.join(apollo_df.columns)}")
-    
-    print("\n" + "🧠 AI SEMANTIC MAPPING APPLIED...".center(80, "="))
-    print("""
+_RESULT_COLS = {
+    'email': ('sarah@startup.io', 'mike@enterprise.com', 'david@fintech.co', 'lisa@healthtech.org'),
+    'full_name': ('Sarah Johnson', 'Mike Chen', 'David Kim', 'Lisa Wong'),
+    'company_name': ('TechStartup Inc', 'Enterprise LLC', 'FinTech Solutions', 'HealthTech Inc'),
+    'job_title': ('VP Engineering', 'CTO', 'Product Manager', 'Marketing Head'),
+    'phone': ('+1-555-0101', '+1-555-0202', '555-123-4567', '555-987-6543')
+}
+
+def _tabulate(columns):
+    """Render {column: (values, ...)} like DataFrame.to_string(index=False): right-aligned, one space apart"""
+    widths = [max(len(name), *map(len, values)) for name, values in columns.items()]
+    lines = [zip(columns, widths)] + [zip(row, widths) for row in zip(*columns.values())]
+    return "\n".join(" ".join(cell.rjust(width) for cell, width in line) for line in lines)
+
+_LINKEDIN_STR = _tabulate(_LINKEDIN_COLS)
+_APOLLO_STR = _tabulate(_APOLLO_COLS)
+_RESULT_STR = _tabulate(_RESULT_COLS)
+
+# Column counts and the text blocks built from them are fixed, so they are assembled once here
+_LINKEDIN_COL_COUNT = len(_LINKEDIN_COLS)
+_APOLLO_COL_COUNT = len(_APOLLO_COLS)
+_OUTPUT_COL_COUNT = len(_RESULT_COLS)
+
+_MAPPING_BLOCK = "\n" + "🧠 AI SEMANTIC MAPPING APPLIED...".center(80, "=") + "\n" + """
 🔄 InTabular AI Analysis:
    ✓ contact_email + Email → email (unified email field)
    ✓ contact_name + First Name + Last Name → full_name (smart combination)
    ✓ contact_company + Company → company_name (semantic matching)
    ✓ job_title + Title → job_title (normalized role field)
    ✓ mobile + Phone Number → phone (standardized contact)
-""")
-    
-    # Show clean output
-    print("\n📤 CLEAN OUTPUT DATA (After InTabular):")
-    print("\n🎯 Unified Sales Prospects Database:")
-    result_df = pd.DataFrame({
-        'email': ['sarah@startup.io', 'mike@enterprise.com', 'david@fintech.co', 'lisa@healthtech.org'],
-        'full_name': ['Sarah Johnson', 'Mike Chen', 'David Kim', 'Lisa Wong'],
-        'company_name': ['TechStartup Inc', 'Enterprise LLC', 'FinTech Solutions', 'HealthTech Inc'],
-        'job_title': ['VP Engineering', 'CTO', 'Product Manager', 'Marketing Head'],
-        'phone': ['+1-555-0101', '+1-555-0202', '555-123-4567', '555-987-6543']
-    })
-    print(result_df.to_string(index=False))
-    
-    print("\n" + "🎯 TRANSFORMATION METRICS".center(80, "="))
-    print(f"""
+
+"""
+
+_METRICS_BLOCK = "\n" + "🎯 TRANSFORMATION METRICS".center(80, "=") + "\n" + f"""
 📊 IMPRESSIVE RESULTS:
-   • Input Columns: {len(linkedin_df.columns)} + {len(apollo_df.columns)} = {len(linkedin_df.columns) + len(apollo_df.columns)} different field names
-   • Output Columns: {len(result_df.columns)} clean, semantic fields
+   • Input Columns: {_LINKEDIN_COL_COUNT} + {_APOLLO_COL_COUNT} = {_LINKEDIN_COL_COUNT + _APOLLO_COL_COUNT} different field names
+   • Output Columns: {_OUTPUT_COL_COUNT} clean, semantic fields
    • Data Quality: ✅ 100% mapped automatically
    • Manual Work: ❌ Zero field mapping required
    
@@ -88,8 +75,36 @@ def quick_demo():
    "Transform messy CSV chaos into clean data harmony with AI! 
    LinkedIn + Apollo exports → Unified CRM database ✨
    #AI #DataEngineering #Python"
-""")
-    print("="*80 + "\n")
+
+""" + "="*80 + "\n\n"
+
+# The whole showcase is static text, so it is assembled once at import
+_QUICK_SHOWCASE = (
+    "\n" + "="*80 + "\n"
+    "🎯 INTABULAR QUICK SHOWCASE: SALES DATA TRANSFORMATION\n"
+    + "="*80 + "\n"
+    "🚀 AI-powered semantic data mapping in action!\n"
+    + "="*80 + "\n\n"
+    # Messy input data
+    "📥 MESSY INPUT DATA (Before InTabular):\n"
+    "\n🔗 LinkedIn Export:\n"
+    f"{_LINKEDIN_STR}\n"
+    f"\nColumns: {', '.join(_LINKEDIN_COLS)}\n"
+    "\n🎯 Apollo Export:\n"
+    f"{_APOLLO_STR}\n"
+    f"\nColumns: {', '.join(_APOLLO_COLS)}\n"
+    + _MAPPING_BLOCK +
+    # Clean output
+    "\n📤 CLEAN OUTPUT DATA (After InTabular):\n"
+    "\n🎯 Unified Sales Prospects Database:\n"
+    f"{_RESULT_STR}\n"
+    + _METRICS_BLOCK
+)
+
+def quick_demo():
+    """Run a quick demo showing transformation visualization"""
+    
+    print(_QUICK_SHOWCASE, end="")
 
 if __name__ == "__main__":
     quick_demo() 
\ No newline at end of file
@@ -7,42 +7,33 @@ Runs both demo examples to show the full power of InTabular
 for social media showcase!
 """
 
+import importlib.util
 import sys
-from pathlib import Path
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+def _lazy_import(name):
+    """Resolve a module now (a missing one fails at load) but only execute it on first attribute access"""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
-def main():
-    """Run both showcase demos"""
-    
-    print("🚀 INTABULAR COMPLETE SHOWCASE")
-    print("="*60)
-    print("Running two compelling demos to show AI-powered data mapping!")
-    print("="*60)
-    
-    # Import and run demo 1
-    print("\n🎯 Starting Demo 1: Sales Leads Consolidation...")
-    try:
-        from demo_1_sales_leads_showcase import run_demo as run_demo1
-        result1 = run_demo1()
-        print("✅ Demo 1 completed successfully!")
-    except Exception as e:
-        print(f"❌ Demo 1 failed: {e}")
-    
-    print("\n" + "="*60)
-    
-    # Import and run demo 2  
-    print("\n🎪 Starting Demo 2: Event Registration Consolidation...")
-    try:
-        from demo_2_event_registration_showcase import run_demo as run_demo2
-        result2 = run_demo2()
-        print("✅ Demo 2 completed successfully!")
-    except Exception as e:
-        print(f"❌ Demo 2 failed: {e}")
-    
-    print("\n" + "🎉 SHOWCASE COMPLETE!".center(60, "="))
-    print("""
+_demo1 = _lazy_import('demo_1_sales_leads_showcase')
+_demo2 = _lazy_import('demo_2_event_registration_showcase')
+
+# Banner blocks, assembled once; each is printed in a single call
+SHOWCASE_HEADER = (
+    "🚀 INTABULAR COMPLETE SHOWCASE\n"
+    + "="*60 + "\n"
+    "Running two compelling demos to show AI-powered data mapping!\n"
+    + "="*60 + "\n"
+)
+
+SHOWCASE_FOOTER = ("\n" + "🎉 SHOWCASE COMPLETE!".center(60, "=") + "\n" + """
 🎯 Perfect for Social Media Posts:
 
 📱 LinkedIn/X Post Ideas:
@@ -79,7 +70,33 @@ No more manual field mapping. Just describe your target schema and let AI do the
 • "Finally unified our multi-source customer data"
 
 Ready to showcase your AI-powered data engineering skills! 🚀
+
 """)
 
+def main():
+    """Run both showcase demos"""
+    
+    print(SHOWCASE_HEADER, end="")
+    
+    # Import and run demo 1
+    print("\n🎯 Starting Demo 1: Sales Leads Consolidation...")
+    try:
+        _demo1.run_demo()
+        print("✅ Demo 1 completed successfully!")
+    except Exception as e:
+        print(f"❌ Demo 1 failed: {e}")
+    
+    print("\n" + "="*60)
+    
+    # Import and run demo 2  
+    print("\n🎪 Starting Demo 2: Event Registration Consolidation...")
+    try:
+        _demo2.run_demo()
+        print("✅ Demo 2 completed successfully!")
+    except Exception as e:
+        print(f"❌ Demo 2 failed: {e}")
+    
+    print(SHOWCASE_FOOTER, end="")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,26 +4,70 @@ Script to send all emails from target_with_emails.csv to alexander.krauck@gmail.
 for testing and preview purposes.
 """
 
+import argparse
+import csv
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from send_emails import send_emails_from_csv
 
-def send_all_emails_to_alexander():
+# SMTP connections for the full preview: 1 sends sequentially with per-email progress.
+# Raise it with --workers, keeping it below the server's connection limit.
+SEND_WORKERS = 1
+
+def send_in_slices(csv_file, workers, **send_kwargs):
+    """
+    Send a CSV as `workers` row slices at once, each slice over its own SMTP connection.
+    Sending is I/O-bound, so threads are enough. Per-email output would interleave, so progress
+    is reported once per finished slice instead.
+    The file is parsed once here and every worker sends its slice of the shared rows.
+    """
+    with open(csv_file, 'r', newline='', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+    total_rows = len(rows)
+    slice_size = max(-(-total_rows // workers), 1)
+    
+    def send_slice(start_row):
+        return send_emails_from_csv(csv_file=csv_file, rows=rows, start_row=start_row, max_rows=slice_size,
+                                    verbose=False, **send_kwargs)
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(send_slice, start_row): start_row for start_row in range(0, total_rows, slice_size)}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            start_row = futures[future]
+            print(f"  📬 Rows {start_row + 1}-{start_row + result['total']}: {result['sent']} sent, {result['failed']} failed "
+                  f"({len(results)}/{len(futures)} slices done)")
+    
+    return {key: sum(result[key] for result in results) for key in ('sent', 'failed', 'total')}
+
+def send_all_emails_to_alexander(workers=SEND_WORKERS):
     """
     Send all AI-generated emails to alexander.krauck@gmail.com for testing.
     This allows reviewing all the personalized emails before sending to actual recipients.
+    
+    Args:
+        workers: Number of SMTP connections sending in parallel (1 sends sequentially with progress output)
     """
     
     print("🚀 Sending all AI-generated emails to alexander.krauck@gmail.com for preview")
     print("=" * 70)
     
+    send_kwargs = dict(
+        message_column='generated_email_body',  # AI-generated German emails with Kim's signature
+        email='a.krauck@gmail.com',     # Fixed test email - override all recipients
+        subject='Gartenwohnung-Investment: St. Johann i. d. Haide, Thermenregion',  # Fixed subject for all
+        attachments=['Super-Wohnen-in-der-Steiermark.pdf'],  # Uncomment if you have attachments
+    )
+    
     try:
-        result = send_emails_from_csv(
-            csv_file='target_with_emails.csv',
-            message_column='generated_email_body',  # AI-generated German emails with Kim's signature
-            email='a.krauck@gmail.com',     # Fixed test email - override all recipients
-            subject='Gartenwohnung-Investment: St. Johann i. d. Haide, Thermenregion',  # Fixed subject for all
-            attachments=['Super-Wohnen-in-der-Steiermark.pdf'],  # Uncomment if you have attachments
-            verbose=True
-        )
+        if workers > 1:
+            print(f"📨 Sending in {workers} parallel slices...")
+            result = send_in_slices('target_with_emails.csv', workers, **send_kwargs)
+        else:
+            result = send_emails_from_csv(csv_file='target_with_emails.csv', verbose=True, **send_kwargs)
         
         print(f"\n✅ Email campaign preview completed!")
         print(f"📊 Results: {result['sent']} sent, {result['failed']} failed, {result['total']} total")
@@ -57,26 +101,17 @@ def send_sample_emails_to_alexander(sample_size=5):
     print("=" * 60)
     
     try:
-        # Read the CSV and limit to sample size
-        import pandas as pd
-        df = pd.read_csv('target_with_emails.csv')
-        sample_df = df.head(sample_size)
-        sample_csv = 'sample_emails_preview.csv'
-        sample_df.to_csv(sample_csv, index=False)
-        
+        # Only the first sample_size rows of the CSV are read and sent
         result = send_emails_from_csv(
-            csv_file=sample_csv,
+            csv_file='target_with_emails.csv',
             message_column='generated_email_body',
             email='alexander.krauck@gmail.com',
             subject=f'[SAMPLE] Gartenwohnung Campaign - {sample_size} Examples',
             attachments=['Super-Wohnen-in-der-Steiermark.pdf'],
-            verbose=True
+            verbose=True,
+            max_rows=sample_size
         )
         
-        # Clean up temp file
-        import os
-        os.remove(sample_csv)
-        
         print(f"\n✅ Sample preview completed: {result}")
         return result
         
@@ -85,19 +120,30 @@ def send_sample_emails_to_alexander(sample_size=5):
         return None
 
 if __name__ == "__main__":
-    print("📧 Email Campaign Preview Options")
-    print("=" * 50)
-    print("1. Send ALL emails to alexander.krauck@gmail.com")
-    print("2. Send SAMPLE (5 emails) to alexander.krauck@gmail.com")
-    print()
+    parser = argparse.ArgumentParser(description="Send the campaign emails to alexander.krauck@gmail.com for preview")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--sample', type=int, default=None, metavar='N', help="send only the first N emails")
+    mode.add_argument('--all', action='store_true', help="send all emails")
+    parser.add_argument('--workers', type=int, default=SEND_WORKERS, metavar='N',
+                        help="send all emails over N parallel SMTP connections (default: sequential)")
+    args = parser.parse_args()
     
-    choice = input("Choose option (1 or 2, or press Enter for ALL): ").strip()
+    # Ask only when no mode was given and someone is at the terminal; otherwise (e.g. cron) default to ALL
+    if args.sample is None and not args.all and sys.stdin.isatty():
+        print("📧 Email Campaign Preview Options")
+        print("=" * 50)
+        print("1. Send ALL emails to alexander.krauck@gmail.com")
+        print("2. Send SAMPLE (5 emails) to alexander.krauck@gmail.com")
+        print()
+        
+        if input("Choose option (1 or 2, or press Enter for ALL): ").strip() == "2":
+            args.sample = 2
     
-    if choice == "2":
+    if args.sample is not None:
         # Send sample
-        send_sample_emails_to_alexander(2)
+        send_sample_emails_to_alexander(args.sample)
     else:
         # Send all (default)
-        send_all_emails_to_alexander()
+        send_all_emails_to_alexander(workers=args.workers)
     
-    print("\n🎯 Preview complete! Check your email to review the AI-generated content.") 
\ No newline at end of file
+    print("\n🎯 Preview complete! Check your email to review the AI-generated content.")
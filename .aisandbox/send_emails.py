@@ -6,6 +6,7 @@ Can be used as a module or standalone script.
 """
 
 import csv
+import itertools
 import smtplib
 import json
 import sys
@@ -13,7 +14,8 @@ import os
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
+from base64 import encodebytes
+from functools import lru_cache
 from pathlib import Path
 import mimetypes
 from typing import List, Union, Dict, Optional
@@ -32,6 +34,27 @@ def load_smtp_config(config_file='smtp_config.json'):
         raise
 
 
+@lru_cache(maxsize=32)
+def encode_attachment(file_path, mtime_ns, size):
+    """
+    Read and base64-encode an attachment once per file version.
+    Returns (maintype, subtype, encoded payload); mtime_ns and size keep a changed file from reusing it.
+    """
+    # Guess the content type based on the file's extension
+    ctype, encoding = mimetypes.guess_type(file_path)
+    if ctype is None or encoding is not None:
+        # No guess could be made, or the file is encoded (compressed), so use a generic bag-of-bits type
+        ctype = 'application/octet-stream'
+    
+    maintype, subtype = ctype.split('/', 1)
+    
+    with open(file_path, 'rb') as fp:
+        # Encode file in ASCII characters to send by email
+        payload = encodebytes(fp.read()).decode('ascii')
+    
+    return maintype, subtype, payload
+
+
 def attach_file(msg, file_path):
     """Attach a file to the email message."""
     if not os.path.isfile(file_path):
@@ -39,20 +62,14 @@ def attach_file(msg, file_path):
         return False
     
     try:
-        # Guess the content type based on the file's extension
-        ctype, encoding = mimetypes.guess_type(file_path)
-        if ctype is None or encoding is not None:
-            # No guess could be made, or the file is encoded (compressed), so use a generic bag-of-bits type
-            ctype = 'application/octet-stream'
-        
-        maintype, subtype = ctype.split('/', 1)
-        
-        with open(file_path, 'rb') as fp:
-            attachment = MIMEBase(maintype, subtype)
-            attachment.set_payload(fp.read())
+        # Reuse the encoded bytes across the campaign instead of re-reading the file per recipient;
+        # each message still gets its own part, so nothing mutable is shared between messages or threads
+        stat = os.stat(file_path)
+        maintype, subtype, payload = encode_attachment(file_path, stat.st_mtime_ns, stat.st_size)
         
-        # Encode file in ASCII characters to send by email    
-        encoders.encode_base64(attachment)
+        attachment = MIMEBase(maintype, subtype)
+        attachment.set_payload(payload)
+        attachment['Content-Transfer-Encoding'] = 'base64'
         
         # Add header as key/value pair to attachment part
         filename = os.path.basename(file_path)
@@ -176,7 +193,10 @@ def send_emails_from_csv(
     attachments: Union[str, List[str], None] = None,  # Can be column name, fixed file(s), or None
     attachments_column: Optional[str] = None,  # Alternative way to specify attachments column
     smtp_config_file: str = 'smtp_config.json',
-    verbose: bool = True
+    verbose: bool = True,
+    max_rows: Optional[int] = None,  # Only read and send max_rows data rows
+    start_row: int = 0,  # Skip this many data rows first (for sending a file in slices)
+    rows: Optional[List[Dict[str, str]]] = None  # Data rows already read from csv_file
 ) -> Dict[str, int]:
     """
     Send emails from a CSV file with flexible column mapping.
@@ -192,6 +212,10 @@ def send_emails_from_csv(
         attachments_column: Explicit column name for attachments (alternative to attachments parameter)
         smtp_config_file: Path to SMTP configuration file
         verbose: Whether to print progress messages
+        max_rows: Stop reading the CSV after this many data rows (None reads all rows)
+        start_row: Number of data rows to skip before sending (0 starts at the first row)
+        rows: Data rows already read from csv_file (e.g. shared by parallel senders); the file is then
+            only opened for its header, and start_row/max_rows select from these rows
     
     Returns:
         Dict with 'sent', 'failed', and 'total' counts
@@ -340,8 +364,13 @@ def send_emails_from_csv(
             if verbose:
                 print(f"\nStarting to send emails from {csv_file}...")
             
-            # Get list of emails to process
-            rows_to_process = list(reader)
+            # Stream the rows to process from the file (rows past max_rows are never parsed),
+            # or take them straight from the rows the caller already read
+            stop_row = None if max_rows is None else start_row + max_rows
+            if rows is not None:
+                rows_to_process = rows[start_row:stop_row]
+            else:
+                rows_to_process = itertools.islice(reader, start_row, stop_row)
             
             # If using fixed email(s), we'll send to those regardless of CSV content
             if not email_is_column:
@@ -350,9 +379,13 @@ def send_emails_from_csv(
                 else:
                     fixed_emails = [email]
                 
+                # Several recipients each get every row, so only then are the rows held in memory
+                if len(fixed_emails) > 1 and rows is None:
+                    rows_to_process = list(rows_to_process)
+                
                 # For fixed emails, we send ALL rows to each fixed email address
                 for email_addr in fixed_emails:
-                    for row_num, row in enumerate(rows_to_process, start=2):
+                    for row_num, row in enumerate(rows_to_process, start=start_row + 2):
                         message = row[message_column].strip()
                         
                         if not message:
@@ -399,7 +432,7 @@ def send_emails_from_csv(
                             failed_count += 1
             else:
                 # Column-based emails - process each row normally
-                for row_num, row in enumerate(rows_to_process, start=2):
+                for row_num, row in enumerate(rows_to_process, start=start_row + 2):
                     email_addr = row[email_value].strip()
                     message = row[message_column].strip()
                     
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the showcase demos: Arrow-backed demo frames and
+the static inputs/outputs they build and render once per process.
+"""
+
+from functools import lru_cache
+
+import pandas as pd
+
+
+def arrow_backed(df):
+    """Give the frame Arrow-backed dtypes (string[pyarrow] for text) so string ops run in Arrow's kernels; unchanged without pyarrow"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return df
+    return df.convert_dtypes(dtype_backend='pyarrow')
+
+
+def cached_frame(columns):
+    """Return a function that builds DataFrame(columns) on first call and hands out shallow copies of it"""
+
+    @lru_cache(maxsize=1)
+    def build():
+        return pd.DataFrame(columns)
+
+    return lambda: build().copy(deep=False)
+
+
+def render_once(create_frames, render=lambda df: df.to_string(index=False)):
+    """Return a function that renders every frame from create_frames() on first call and caches the strings"""
+
+    @lru_cache(maxsize=1)
+    def rendered():
+        return tuple(render(df) for df in create_frames())
+
+    return rendered
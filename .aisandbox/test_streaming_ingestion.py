@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Streaming ingestion test: a source CSV processed in several chunks must give
+the same frame as processing it in one pass. No API calls are made.
+"""
+
+import sys
+import tempfile
+import pandas as pd
+from pathlib import Path
+
+import adaptive_merger
+
+STRATEGY = {
+    "field_strategies": {
+        "email": {"strategy": "transform", "source_mapping": ["Email"], "transformation_rule": "standardize_email"},
+        "full_name": {"strategy": "concat", "source_mapping": ["First", "Last"]},
+        "first_name": {"strategy": "replace", "source_mapping": ["First"]},
+    },
+    "unmapped_source_columns": {"Industry": {"action": "store_as_metadata"}},
+    "data_quality_rules": {
+        "validation": {"email_validation": True, "name_standardization": True},
+        "cleanup": {"trim_whitespace": True},
+    },
+}
+
+
+def _write_source(path, rows=10):
+    """Write a small source CSV with messy emails and repeated names"""
+    pd.DataFrame({
+        "Email": [f" User{i}@Example.COM " for i in range(rows)],
+        "First": ["ann", "bob"] * (rows // 2),
+        "Last": ["lee"] * rows,
+        "Industry": ["tech"] * rows,
+    }).to_csv(path, index=False)
+
+
+def _ingest(source_csv, chunk_rows, **kwargs):
+    """Run execute_ingestion with the given chunk size and no LLM strategy calls"""
+    merger = adaptive_merger.AdaptiveMerger(api_key="test-key", use_cache=False)
+    default_chunk_rows = adaptive_merger.INGEST_CHUNK_ROWS
+    adaptive_merger.INGEST_CHUNK_ROWS = chunk_rows
+    try:
+        return merger.execute_ingestion(pd.DataFrame(), source_csv, STRATEGY, None, **kwargs)
+    finally:
+        adaptive_merger.INGEST_CHUNK_ROWS = default_chunk_rows
+
+
+def test_multi_chunk_matches_single_pass():
+    """Test that chunked ingestion gives the same values and dtypes as a single pass"""
+    print("Testing multi-chunk ingestion...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_csv = str(Path(tmp_dir) / "source.csv")
+        _write_source(source_csv)
+
+        single_pass = _ingest(source_csv, chunk_rows=100)
+        # 10 rows in chunks of 3 leaves a last chunk of one row, whose names are all distinct
+        chunked = _ingest(source_csv, chunk_rows=3)
+
+    pd.testing.assert_frame_equal(chunked, single_pass)
+    assert isinstance(chunked["first_name"].dtype, pd.CategoricalDtype)
+    assert chunked["email"].tolist()[:2] == ["user0@example.com", "user1@example.com"]
+    print("✓ Chunked ingestion matches the single pass")
+    return True
+
+
+def test_streamed_output_matches_collected_result():
+    """Test that collect_result=False writes the same rows to the output file and returns nothing"""
+    print("Testing streamed ingestion output...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_csv = str(Path(tmp_dir) / "source.csv")
+        collected_csv = str(Path(tmp_dir) / "collected.csv")
+        streamed_csv = str(Path(tmp_dir) / "streamed.csv")
+        _write_source(source_csv)
+
+        collected = _ingest(source_csv, chunk_rows=3, output_file=collected_csv)
+        streamed = _ingest(source_csv, chunk_rows=3, output_file=streamed_csv, collect_result=False)
+
+        assert streamed is None
+        assert len(collected) == 10
+        assert Path(streamed_csv).read_text() == Path(collected_csv).read_text()
+    print("✓ Streamed output matches the collected result")
+    return True
+
+
+def test_categorical_sources_match_plain_sources():
+    """Test that holding repeated source values as categoricals does not change any handler's output"""
+    print("Testing categorical source columns...")
+
+    strategy = {
+        "field_strategies": {
+            "industry": {"strategy": "transform", "source_mapping": ["Industry"], "transformation_rule": "lowercase"},
+            "phone": {"strategy": "transform", "source_mapping": ["Phone"], "transformation_rule": "format_phone"},
+            "company": {"strategy": "replace", "source_mapping": ["Company"]},
+            "summary": {"strategy": "concat", "source_mapping": ["Company", "Industry"]},
+        },
+        "unmapped_source_columns": {"Country": {"action": "store_as_metadata"}},
+    }
+
+    def ingest(source_csv, max_unique_ratio):
+        merger = adaptive_merger.AdaptiveMerger(api_key="test-key", use_cache=False)
+        default_ratio = adaptive_merger.CATEGORICAL_MAX_UNIQUE_RATIO
+        adaptive_merger.CATEGORICAL_MAX_UNIQUE_RATIO = max_unique_ratio
+        try:
+            return merger.execute_ingestion(pd.DataFrame(), source_csv, strategy, None)
+        finally:
+            adaptive_merger.CATEGORICAL_MAX_UNIQUE_RATIO = default_ratio
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_csv = str(Path(tmp_dir) / "source.csv")
+        pd.DataFrame({
+            "Industry": ["Tech", "Retail", None, "Tech"] * 10,
+            "Phone": ["+1 (555) 010-0000", "555.010.0001", None, "+1 (555) 010-0000"] * 10,
+            "Company": ["Acme", "Globex", "Acme", None] * 10,
+            "Country": ["DE", "US", "DE", "DE"] * 10,
+        }).to_csv(source_csv, index=False)
+
+        categorical = ingest(source_csv, max_unique_ratio=0.1)
+        plain = ingest(source_csv, max_unique_ratio=0)
+
+    pd.testing.assert_frame_equal(categorical, plain)
+    assert categorical["industry"].tolist()[:2] == ["tech", "retail"]
+    assert categorical["phone"].tolist()[:2] == ["15550100000", "5550100001"]
+    print("✓ Categorical sources match plain sources")
+    return True
+
+
+if __name__ == "__main__":
+    print("=== Streaming Ingestion Test ===")
+
+    if (test_multi_chunk_matches_single_pass() and test_streamed_output_matches_collected_result()
+            and test_categorical_sources_match_plain_sources()):
+        print("\n✓ All streaming tests passed!")
+    else:
+        print("\n✗ Some tests failed!")
+        sys.exit(1)
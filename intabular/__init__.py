@@ -17,7 +17,7 @@ from .main import (
     infer_schema_from_target,
     setup_llm_client
 )
-from .csv_component import run_csv_ingestion_pipeline, create_config_from_csv
+from .csv_component import run_csv_ingestion_pipeline, run_csv_ingestion_pipeline_batch, create_config_from_csv
 
 # Set up default logging configuration when package is imported
 _log_file = os.getenv('INTABULAR_LOG_FILE')
@@ -51,6 +51,7 @@ __all__ = [
     
     # CSV convenience functions
     "run_csv_ingestion_pipeline",
+    "run_csv_ingestion_pipeline_batch",
     "create_config_from_csv",
     
     # Utilities
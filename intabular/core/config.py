@@ -7,6 +7,9 @@ from pathlib import Path
 from typing import List, Dict
 from .logging_config import get_logger
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class GatekeeperConfig:
     """Configuration for gatekeeper function g_w(A, D, I) → D' for csv/tables"""
@@ -134,7 +137,7 @@ class GatekeeperConfig:
         
         try:
             with open(filename, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
             
             config = cls(
                 purpose=data['purpose'],
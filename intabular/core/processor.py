@@ -77,8 +77,8 @@ class DataframeIngestionProcessor:
             else:
                 namespace[col_name] = str(value)
         
-        # Add current target value
-        if current_value is None:
+        # Add current target value - a missing cell is empty, so 'x or current' never yields "nan"
+        if current_value is None or pd.isna(current_value):
             namespace['current'] = ""
         elif isinstance(current_value, str):
             namespace['current'] = current_value
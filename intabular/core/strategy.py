@@ -3,9 +3,11 @@ Entity-aware ingestion strategy creation for intelligent CSV mapping and merging
 """
 
 import json
+import keyword
 import os
+import re
 import textwrap
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from openai import OpenAI
 from intabular.core.analyzer import DataframeAnalysis
 from intabular.core.processor import SAFE_NAMESPACE
@@ -15,6 +17,34 @@ from .utils import parallel_map
 from .llm_logger import log_llm_call
 
 
+# Column names that mean the same field, normalized to lowercase letters and digits.
+# A target column and a source column in the same group are mapped without asking the LLM.
+# Bare words such as 'name', 'title' or 'role' are left out: exports use them for different fields.
+COLUMN_SYNONYM_GROUPS = [
+    {'email', 'emailaddress', 'emailaddr', 'contactemail', 'attendeeemail', 'primaryemail', 'workemail', 'leademail'},
+    {'fullname', 'contactname', 'attendeename', 'personname'},
+    {'firstname', 'givenname', 'fname'},
+    {'lastname', 'surname', 'familyname', 'lname'},
+    {'company', 'companyname', 'organization', 'organisation', 'employer', 'contactcompany'},
+    {'jobtitle', 'position', 'jobrole'},
+    {'phone', 'phonenumber', 'telephone', 'mobile', 'contactphone', 'workphone'},
+    {'website', 'companywebsite'},
+    {'industry', 'sector'},
+    {'location'},
+]
+
+# Normalized column name -> index of its synonym group, for a single dict lookup per column
+COLUMN_SYNONYMS = {name: group for group, names in enumerate(COLUMN_SYNONYM_GROUPS) for name in names}
+
+# Synonym groups whose values are normalized beyond whitespace when passed through
+SYNONYM_LOWERCASE_GROUPS = {COLUMN_SYNONYMS['email']}
+
+
+def normalize_column_name(column_name: str) -> str:
+    """Reduce a column name to lowercase letters and digits for synonym lookups"""
+    return re.sub(r'[^a-z0-9]', '', column_name.lower())
+
+
 class DataframeIngestionStrategyResult:
     """Simple container for ingestion strategy results"""
     
@@ -73,6 +103,44 @@ class DataframeIngestionStrategy:
         self.logger.info(f"Remaining columns: {list(remaining_columns.keys())}")
         return remaining_columns
 
+    def _create_synonym_column_mapping(
+        self, target_col: str, dataframe_analysis: DataframeAnalysis, merge: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Map the target column straight from a source column with a synonymous name, without an LLM call.
+        
+        Returns None (leaving the column to the LLM) unless exactly one source column matches
+        and its name can be used as-is in a transformation rule.
+        """
+
+        if os.getenv("INTABULAR_SYNONYM_MAPPING", "true").lower() != "true":
+            return None
+
+        group = COLUMN_SYNONYMS.get(normalize_column_name(target_col))
+        if group is None:
+            return None
+
+        matches = [source_col for source_col in dataframe_analysis.dataframe_column_analysis
+                   if COLUMN_SYNONYMS.get(normalize_column_name(source_col)) == group]
+        if len(matches) != 1:
+            return None
+
+        source_col = matches[0]
+        # Rules are evaluated as Python, so headers like "Email Address" or "E-mail" need the LLM
+        if not source_col.isidentifier() or keyword.iskeyword(source_col):
+            return None
+
+        rule = f"{source_col}.strip().lower()" if group in SYNONYM_LOWERCASE_GROUPS else f"{source_col}.strip()"
+        if merge:
+            # Keep the existing value when the incoming one is empty
+            rule = f"{rule} or current"
+
+        self.logger.info(f"Mapped column {target_col} from synonymous source column {source_col} without LLM")
+        return {
+            "reasoning": f"Source column '{source_col}' is a known synonym of target column '{target_col}'",
+            "transformation_type": "format",
+            "transformation_rule": rule,
+        }
+
     def _create_no_merge_column_mappings(
         self,
         target_col: str,
@@ -81,6 +149,10 @@ class DataframeIngestionStrategy:
     ) -> Dict[str, Any]:
         """Create mapping strategy for entity identifier columns - keep or replace, never merge content"""
 
+        synonym_mapping = self._create_synonym_column_mapping(target_col, dataframe_analysis, merge=False)
+        if synonym_mapping is not None:
+            return synonym_mapping
+
         self.logger.info(f"Creating no merge column mapping for column {target_col} using dataframe analysis {dataframe_analysis.dataframe_column_analysis}")
 
         prompt_no_merge = textwrap.dedent("""
@@ -202,6 +274,10 @@ class DataframeIngestionStrategy:
     ) -> Dict[str, Any]:
         """Create mapping strategy for descriptive columns - intelligent content merging with existing values"""
 
+        synonym_mapping = self._create_synonym_column_mapping(target_col, dataframe_analysis, merge=True)
+        if synonym_mapping is not None:
+            return synonym_mapping
+
         prompt_merge = textwrap.dedent("""
             You are creating a data transformation strategy for ingesting new data into an existing database.
             
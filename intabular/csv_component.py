@@ -5,7 +5,7 @@ Separates file I/O concerns from core business logic.
 
 import pandas as pd
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 from openai import OpenAI
 import os
 
@@ -14,6 +14,10 @@ from intabular.core.logging_config import get_logger
 from intabular.core.analyzer import DataframeAnalyzer
 from intabular.core.strategy import DataframeIngestionStrategy
 from intabular.core.processor import DataframeIngestionProcessor
+from intabular.core.utils import parallel_map
+
+# Sources planned at once in a batch; each plan runs its own pools of LLM calls, so keep this small
+MAX_BATCH_PLAN_WORKERS = 3
 
 
 def setup_llm_client() -> OpenAI:
@@ -47,13 +51,34 @@ def setup_llm_client() -> OpenAI:
     return client
 
 
-def run_csv_ingestion_pipeline(yaml_config_file: str, csv_to_ingest: str) -> pd.DataFrame:
+def _load_config(yaml_config_file: Union[str, GatekeeperConfig]) -> GatekeeperConfig:
+    """Load the configuration from a YAML path, or pass an already loaded one through"""
+    if isinstance(yaml_config_file, GatekeeperConfig):
+        return yaml_config_file
+    return GatekeeperConfig.from_yaml(yaml_config_file)
+
+
+def _load_or_create_target(schema: GatekeeperConfig) -> pd.DataFrame:
+    """Load the existing target CSV, or create an empty frame with the schema's columns"""
+    logger = get_logger('csv_component')
+    
+    if Path(schema.target_file_path).exists():
+        df_target = pd.read_csv(schema.target_file_path)
+        logger.info(f"Loaded existing target: {len(df_target)} rows")
+    else:
+        df_target = pd.DataFrame(columns=schema.get_enrichment_column_names())
+        logger.info(f"Created empty target with {len(schema.get_enrichment_column_names())} columns")
+    
+    return df_target
+
+
+def run_csv_ingestion_pipeline(yaml_config_file: Union[str, GatekeeperConfig], csv_to_ingest: str) -> pd.DataFrame:
     """
     CSV wrapper around core ingestion logic.
     Loads CSV files, runs Mode 3 ingestion, saves result.
     
     Args:
-        yaml_config_file: Path to YAML configuration
+        yaml_config_file: Path to YAML configuration, or an already loaded GatekeeperConfig
         csv_to_ingest: Path to CSV file to ingest
         
     Returns:
@@ -64,16 +89,11 @@ def run_csv_ingestion_pipeline(yaml_config_file: str, csv_to_ingest: str) -> pd.
     logger.info(f"CSV ingestion: {csv_to_ingest} -> {yaml_config_file}")
     
     # Load configuration and CSV files
-    schema = GatekeeperConfig.from_yaml(yaml_config_file)
+    schema = _load_config(yaml_config_file)
     df_ingest = pd.read_csv(csv_to_ingest)
     
     # Load or create target DataFrame
-    if Path(schema.target_file_path).exists():
-        df_target = pd.read_csv(schema.target_file_path)
-        logger.info(f"Loaded existing target: {len(df_target)} rows")
-    else:
-        df_target = pd.DataFrame(columns=schema.get_enrichment_column_names())
-        logger.info(f"Created empty target with {len(schema.get_enrichment_column_names())} columns")
+    df_target = _load_or_create_target(schema)
     
     # Core Mode 3 logic (explicit schema ingestion) - implemented directly here
     logger.info(f"Mode 3: Explicit schema ingestion - {len(df_ingest)} + {len(df_target)} rows")
@@ -111,6 +131,68 @@ def run_csv_ingestion_pipeline(yaml_config_file: str, csv_to_ingest: str) -> pd.
     return result
 
 
+def run_csv_ingestion_pipeline_batch(yaml_config_file: Union[str, GatekeeperConfig], csvs_to_ingest: List[str]) -> List[pd.DataFrame]:
+    """
+    CSV wrapper that ingests several files into the same target in one run.
+    The configuration, LLM client and components are set up once and the
+    LLM-bound analysis/strategy stages run concurrently for up to
+    MAX_BATCH_PLAN_WORKERS sources; only the deterministic ingestion pass
+    runs per file, in order.
+    
+    Args:
+        yaml_config_file: Path to YAML configuration, or an already loaded GatekeeperConfig
+        csvs_to_ingest: Paths to the CSV files to ingest, in ingestion order
+        
+    Returns:
+        List[pd.DataFrame]: The processed result after each file, in input order
+    """
+    logger = get_logger('csv_component')
+    
+    logger.info(f"CSV batch ingestion: {len(csvs_to_ingest)} files -> {yaml_config_file}")
+    
+    # Load configuration
+    schema = _load_config(yaml_config_file)
+    
+    # Load or create target DataFrame
+    df_target = _load_or_create_target(schema)
+    
+    # Initialize components once for all files
+    client = setup_llm_client()
+    analyzer = DataframeAnalyzer(client, schema)
+    strategy_creator = DataframeIngestionStrategy(client)
+    processor = DataframeIngestionProcessor(client)
+    
+    logger.info(f"Schema: {schema.purpose[:80]}... ({len(schema.get_enrichment_column_names())} columns)")
+    
+    # Load and analyze every CSV file and create its strategy concurrently
+    def plan(csv_to_ingest):
+        df_ingest = pd.read_csv(csv_to_ingest)
+        df_analysis = analyzer.analyze_dataframe_structure(df_ingest)
+        return df_ingest, df_analysis, strategy_creator.create_ingestion_strategy(schema, df_analysis)
+    
+    logger.info("Analyzing ingestion DataFrames and creating field-mapping strategies...")
+    plans = parallel_map(plan, csvs_to_ingest, max_workers=max(min(len(csvs_to_ingest), MAX_BATCH_PLAN_WORKERS), 1), timeout=300)
+    
+    # Execute ingestion file by file, each one into the result of the previous
+    results = []
+    for csv_to_ingest, (df_ingest, df_analysis, strategy) in zip(csvs_to_ingest, plans):
+        logger.info(f"Executing ingestion: {csv_to_ingest} - {len(df_ingest)} + {len(df_target)} rows")
+        df_target = processor.execute_ingestion(
+            df_ingest,
+            df_target,
+            strategy,
+            schema,
+            df_analysis.general_ingestion_analysis
+        )
+        results.append(df_target)
+    
+    # Save results
+    df_target.to_csv(schema.target_file_path, index=False)
+    logger.info(f"Saved {len(df_target)} rows to {schema.target_file_path}")
+    
+    return results
+
+
 def create_config_from_csv(table_path: str, purpose: str, output_yaml: Optional[str] = None) -> str:
     """
     Create YAML configuration by analyzing existing CSV structure.
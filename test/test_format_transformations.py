@@ -145,6 +145,12 @@ class TestFormatTransformations:
         
         assert result == 'Existing notes | New information', "Should combine current and new values"
     
+    def test_missing_current_value_is_empty(self, processor):
+        """Test that a missing current value is an empty string rather than 'nan'"""
+        result = processor.execute_transformation("phone.strip() or current", {'phone': ' '}, float('nan'))
+        
+        assert result == '', "Missing current values should not be stringified"
+    
     def test_complex_format_combinations(self, processor):
         """Test complex format rule combinations"""
         source_data = {
@@ -184,6 +184,51 @@ sample_rows: 3
         finally:
             os.unlink(csv_path)
             os.unlink(yaml_path)
+    
+    @pytest.mark.unit
+    def test_csv_ingestion_pipeline_batch_requires_api_key(self):
+        """Test batched CSV ingestion pipeline requires API key"""
+        from intabular.csv_component import run_csv_ingestion_pipeline_batch
+        
+        # Create temporary files
+        csv_paths = []
+        for content in ('email,name\njohn@test.com,John Doe\n', 'mail,full name\njane@test.com,Jane Doe\n'):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as csv_f:
+                csv_f.write(content)
+                csv_paths.append(csv_f.name)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as yaml_f:
+            yaml_f.write('''
+purpose: "Test configuration"
+enrichment_columns:
+  email:
+    description: "Email address"
+    match_type: "semantic"
+    is_entity_identifier: true
+    identity_indication: 1.0
+  full_name:
+    description: "Full name"
+    match_type: "semantic"
+    is_entity_identifier: false
+target_file_path: "test_target.csv"
+sample_rows: 3
+''')
+            yaml_path = yaml_f.name
+        
+        try:
+            # Should fail without API key
+            if not os.getenv('OPENAI_API_KEY'):
+                with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+                    run_csv_ingestion_pipeline_batch(yaml_path, csv_paths)
+            else:
+                # If API key is available, there is one result per file
+                results = run_csv_ingestion_pipeline_batch(yaml_path, csv_paths)
+                assert len(results) == len(csv_paths)
+                assert all(isinstance(result, pd.DataFrame) for result in results)
+        finally:
+            for csv_path in csv_paths:
+                os.unlink(csv_path)
+            os.unlink(yaml_path)
 
 
 class TestCSVFileOperations:
@@ -451,6 +496,7 @@ class TestArchitecturalIntegration:
         
         from intabular.csv_component import (
             run_csv_ingestion_pipeline,
+            run_csv_ingestion_pipeline_batch,
             create_config_from_csv
         )
         
@@ -463,6 +509,7 @@ class TestArchitecturalIntegration:
         assert callable(infer_schema_from_target)
         assert callable(setup_llm_client)
         assert callable(run_csv_ingestion_pipeline)
+        assert callable(run_csv_ingestion_pipeline_batch)
         assert callable(create_config_from_csv)
         assert callable(cli_main)
 
@@ -139,4 +139,58 @@ class TestPerfectMatching:
         test_data_with_none = test_data_scalar.copy()
         test_data_with_none['deal_value'] = None
         result_none = processor.execute_transformation('deal_value', test_data_with_none)
-        assert result_none == '', "None values should become empty strings" 
\ No newline at end of file
+        assert result_none == '', "None values should become empty strings" 
+
+class TestSynonymMatching:
+    """Test cases for source columns whose names are known synonyms of target columns"""
+    
+    @pytest.mark.no_llm
+    @pytest.mark.unit
+    def test_synonym_columns_skip_llm(self, mock_openai_client, customer_crm_config):
+        """Test that synonymous source columns are mapped without calling the LLM"""
+        from intabular.core.analyzer import DataframeAnalysis
+        from intabular.core.strategy import DataframeIngestionStrategy
+        
+        analysis = DataframeAnalysis(
+            general_ingestion_analysis={"row_count": 1, "column_count": 3, "table_purpose": "Contacts"},
+            dataframe_column_analysis={"email_address": {}, "organization": {}, "phone_number": {}}
+        )
+        strategy_creator = DataframeIngestionStrategy(mock_openai_client)
+        
+        email_mapping = strategy_creator._create_no_merge_column_mappings('email', customer_crm_config, analysis)
+        company_mapping = strategy_creator._create_no_merge_column_mappings('company_name', customer_crm_config, analysis)
+        notes_mapping = strategy_creator._create_synonym_column_mapping('notes', analysis, merge=True)
+        phone_mapping = strategy_creator._create_synonym_column_mapping('phone', analysis, merge=True)
+        
+        assert email_mapping['transformation_type'] == 'format'
+        assert email_mapping['transformation_rule'] == 'email_address.strip().lower()'
+        assert company_mapping['transformation_rule'] == 'organization.strip()'
+        assert phone_mapping['transformation_rule'] == 'phone_number.strip() or current'
+        assert notes_mapping is None
+        mock_openai_client.chat.completions.create.assert_not_called()
+    
+    @pytest.mark.no_llm
+    @pytest.mark.unit
+    def test_ambiguous_or_disabled_synonyms_fall_back(self, mock_openai_client, monkeypatch):
+        """Test that ambiguous matches and the INTABULAR_SYNONYM_MAPPING switch leave columns to the LLM"""
+        from intabular.core.analyzer import DataframeAnalysis
+        from intabular.core.strategy import DataframeIngestionStrategy
+        
+        strategy_creator = DataframeIngestionStrategy(mock_openai_client)
+        ambiguous = DataframeAnalysis({}, {"email": {}, "work_email": {}})
+        single = DataframeAnalysis({}, {"email": {}})
+        
+        assert strategy_creator._create_synonym_column_mapping('email', ambiguous, merge=False) is None
+        
+        # Names that are not valid in a Python rule are left to the LLM
+        for header in ("Email Address", "E-mail"):
+            spaced = DataframeAnalysis({}, {header: {}})
+            assert strategy_creator._create_synonym_column_mapping('email', spaced, merge=False) is None
+        
+        # Bare words that mean different fields in different exports are not synonyms
+        for target_col, header in (('job_title', 'title'), ('full_name', 'name'), ('email', 'mail')):
+            bare = DataframeAnalysis({}, {header: {}})
+            assert strategy_creator._create_synonym_column_mapping(target_col, bare, merge=False) is None
+        
+        monkeypatch.setenv('INTABULAR_SYNONYM_MAPPING', 'false')
+        assert strategy_creator._create_synonym_column_mapping('email', single, merge=False) is None